@@ -1,5 +1,6 @@
 """Configuration management using Pydantic Settings."""
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Literal, Optional
 
@@ -16,6 +17,10 @@ class AnthropicSettings(BaseSettings):
     model: str = Field(default="claude-sonnet-4-20250514", description="Model to use")
     max_tokens: int = Field(default=4096, description="Max tokens per response")
     temperature: float = Field(default=0.7, description="Temperature for generation")
+    prompt_caching: bool = Field(default=True, description="Mark system prompts for prompt caching")
+    stream_responses: bool = Field(
+        default=True, description="Stream structured replies and parse picks as they arrive"
+    )
 
 
 class DataSourceSettings(BaseSettings):
@@ -118,6 +123,14 @@ class LoopSettings(BaseSettings):
         default=3,
         description="Consecutive loops needed for set stability convergence",
     )
+    batch_layer2: bool = Field(
+        default=False,
+        description="Answer all Layer 2 analysts with one combined LLM request",
+    )
+    layer2_max_concurrency: Optional[int] = Field(
+        default=None,
+        description="Max simultaneous Layer 2 LLM requests (unbounded if unset)",
+    )
 
 
 class HierarchicalSettings(BaseSettings):
@@ -159,17 +172,6 @@ class Settings(BaseSettings):
     )
     debug: bool = Field(default=False, description="Debug mode")
 
-    # Sub-settings
-    anthropic: AnthropicSettings = Field(default_factory=AnthropicSettings)
-    data_sources: DataSourceSettings = Field(default_factory=DataSourceSettings)
-    notifications: NotificationSettings = Field(default_factory=NotificationSettings)
-    scheduler: SchedulerSettings = Field(default_factory=SchedulerSettings)
-    hub: HubSettings = Field(default_factory=HubSettings)
-    swarm: SwarmSettings = Field(default_factory=SwarmSettings)
-    loop: LoopSettings = Field(default_factory=LoopSettings)
-    hierarchical: HierarchicalSettings = Field(default_factory=HierarchicalSettings)
-    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
-
     # Paths
     prompts_path: Path = Field(
         default=Path("config/agent_prompts.yaml"),
@@ -184,7 +186,51 @@ class Settings(BaseSettings):
         description="Directory for report templates",
     )
 
+    # Sub-settings are resolved on first access so a run only validates the
+    # subsystems it actually touches.
+    @cached_property
+    def anthropic(self) -> AnthropicSettings:
+        return AnthropicSettings()
+
+    @cached_property
+    def data_sources(self) -> DataSourceSettings:
+        return DataSourceSettings()
+
+    @cached_property
+    def notifications(self) -> NotificationSettings:
+        return NotificationSettings()
+
+    @cached_property
+    def scheduler(self) -> SchedulerSettings:
+        return SchedulerSettings()
+
+    @cached_property
+    def hub(self) -> HubSettings:
+        return HubSettings()
 
+    @cached_property
+    def swarm(self) -> SwarmSettings:
+        return SwarmSettings()
+
+    @cached_property
+    def loop(self) -> LoopSettings:
+        return LoopSettings()
+
+    @cached_property
+    def hierarchical(self) -> HierarchicalSettings:
+        return HierarchicalSettings()
+
+    @cached_property
+    def database(self) -> DatabaseSettings:
+        return DatabaseSettings()
+
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings singleton."""
     return Settings()
+
+
+def reset_settings() -> None:
+    """Clear the cached settings so the next access re-reads the environment."""
+    get_settings.cache_clear()
@@ -2,19 +2,20 @@
 
 import asyncio
 import logging
-from datetime import datetime
+import signal
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Awaitable, Iterable, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-
 from config.settings import get_settings, Settings
 from src.hub.runner import run_daily_landscape
 from scripts.build_hub import build_hub
 from src.swarm.runner import SwarmRunner
 from src.agents.registry import AgentRegistry
-from src.data_sources.registry import create_default_registry
+from src.data_sources.registry import get_data_registry
 from src.notifications.discord_notifier import DiscordNotifier
 from src.notifications.email_notifier import EmailNotifier
 from src.notifications.slack_notifier import SlackNotifier
@@ -30,6 +31,31 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_agent_registry(prompts_path: Path) -> AgentRegistry:
+    """Get the process-wide agent registry for a prompts file."""
+    return AgentRegistry(prompts_path)
+
+
+@lru_cache(maxsize=8)
+def _build_trigger(expr: str, tz: str) -> CronTrigger:
+    """Build a cron trigger from a crontab expression.
+
+    Expressions with fewer than five fields are padded with ``*`` so
+    shorthand such as ``"0 6"`` keeps working.
+    """
+    parts = expr.split()
+    if len(parts) < 5:
+        parts += ["*"] * (5 - len(parts))
+    return CronTrigger.from_crontab(" ".join(parts), timezone=tz)
+
+
+@lru_cache(maxsize=1)
+def _get_report_generator(templates_dir: Path, output_dir: Path) -> ReportGenerator:
+    """Get the process-wide report generator for a template/output pair."""
+    return ReportGenerator(templates_dir=templates_dir, output_dir=output_dir)
+
+
 class ResearchRunner:
     """Runs scheduled research jobs."""
 
@@ -49,43 +75,21 @@ class ResearchRunner:
             Path("data/state"),
         )
 
-        # Initialize data sources
-        self._data_registry = create_default_registry(
-            news_api_key=(
-                settings.data_sources.news_api_key.get_secret_value()
-                if settings.data_sources.news_api_key
-                else None
-            ),
-            alpha_vantage_key=(
-                settings.data_sources.alpha_vantage_key.get_secret_value()
-                if settings.data_sources.alpha_vantage_key
-                else None
-            ),
-            sec_user_agent=settings.data_sources.sec_user_agent,
-            fred_api_key=(
-                settings.data_sources.fred_api_key.get_secret_value()
-                if settings.data_sources.fred_api_key
-                else None
-            ),
-            github_token=(
-                settings.data_sources.github_token.get_secret_value()
-                if settings.data_sources.github_token
-                else None
-            ),
-        )
-
-        # Initialize agent registry
-        self._agent_registry = AgentRegistry(settings.prompts_path)
+        # Shared, stateless components are built once per process
+        self._data_registry = get_data_registry(settings.data_sources)
+        self._agent_registry = _get_agent_registry(settings.prompts_path)
 
         # Initialize notifiers
         self._email = EmailNotifier(settings.notifications)
         self._slack = SlackNotifier(settings.notifications)
         self._discord = DiscordNotifier(settings.notifications)
+        self._enabled_notifiers = tuple(
+            n for n in (self._email, self._slack, self._discord) if n.is_enabled
+        )
 
-        # Initialize report generator
-        self._report_generator = ReportGenerator(
-            templates_dir=settings.templates_dir,
-            output_dir=settings.reports_dir,
+        self._report_generator = _get_report_generator(
+            settings.templates_dir,
+            settings.reports_dir,
         )
 
     async def initialize(self) -> None:
@@ -139,6 +143,7 @@ class ResearchRunner:
             return
 
         logger.info("Starting hub pipeline run")
+        date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         try:
             outputs = await run_daily_landscape(
                 mappings_path=self.settings.hub.mappings_path,
@@ -147,12 +152,12 @@ class ResearchRunner:
                 top_themes=self.settings.hub.top_themes,
                 top_companies=self.settings.hub.top_companies,
                 include_memos=self.settings.hub.include_memos,
+                report_date=date_str,
             )
 
             logger.info("Hub pipeline outputs: %s", outputs)
 
             if self.settings.hub.build_static:
-                date_str = datetime.utcnow().strftime("%Y-%m-%d")
                 build_hub(
                     report_date=date_str,
                     reports_dir=self.settings.hub.output_dir,
@@ -193,25 +198,13 @@ class ResearchRunner:
             picks: Final picks
             report_path: Path to report
         """
-        tasks = []
-
-        if self._email.is_enabled:
-            tasks.append(
-                self._email.send_research_complete(run_id, summary, report_path)
+        # Email links to the report; chat notifiers render the picks inline
+        await self._notify_all(
+            notifier.send_research_complete(
+                run_id, summary, report_path if notifier is self._email else picks
             )
-
-        if self._slack.is_enabled:
-            tasks.append(
-                self._slack.send_research_complete(run_id, summary, picks)
-            )
-
-        if self._discord.is_enabled:
-            tasks.append(
-                self._discord.send_research_complete(run_id, summary, picks)
-            )
-
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+            for notifier in self._enabled_notifiers
+        )
 
     async def _send_error_notifications(self, error: str) -> None:
         """Send error notifications.
@@ -221,19 +214,22 @@ class ResearchRunner:
         """
         run_id = f"error_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
 
-        tasks = []
-
-        if self._email.is_enabled:
-            tasks.append(self._email.send_error(run_id, error))
+        await self._notify_all(
+            notifier.send_error(run_id, error) for notifier in self._enabled_notifiers
+        )
 
-        if self._slack.is_enabled:
-            tasks.append(self._slack.send_error(run_id, error))
+    async def _notify_all(self, sends: Iterable[Awaitable[Any]]) -> None:
+        """Run one send per enabled notifier concurrently.
 
-        if self._discord.is_enabled:
-            tasks.append(self._discord.send_error(run_id, error))
+        A failing notifier is logged and never cancels the others.
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            sends: One awaitable per enabled notifier, in _enabled_notifiers order
+        """
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        for notifier, result in zip(self._enabled_notifiers, results):
+            if isinstance(result, Exception):
+                logger.warning(f"{type(notifier).__name__} notification failed: {result}")
 
     def setup_scheduler(self) -> AsyncIOScheduler:
         """Setup the APScheduler.
@@ -243,15 +239,9 @@ class ResearchRunner:
         """
         self._scheduler = AsyncIOScheduler(timezone=self.settings.scheduler.timezone)
 
-        # Parse cron expression
-        cron_parts = self.settings.scheduler.cron_expression.split()
-        trigger = CronTrigger(
-            minute=cron_parts[0] if len(cron_parts) > 0 else "*",
-            hour=cron_parts[1] if len(cron_parts) > 1 else "*",
-            day=cron_parts[2] if len(cron_parts) > 2 else "*",
-            month=cron_parts[3] if len(cron_parts) > 3 else "*",
-            day_of_week=cron_parts[4] if len(cron_parts) > 4 else "*",
-            timezone=self.settings.scheduler.timezone,
+        trigger = _build_trigger(
+            self.settings.scheduler.cron_expression,
+            self.settings.scheduler.timezone,
         )
 
         self._scheduler.add_job(
@@ -263,14 +253,9 @@ class ResearchRunner:
         )
 
         if self.settings.hub.enabled:
-            hub_parts = self.settings.hub.cron_expression.split()
-            hub_trigger = CronTrigger(
-                minute=hub_parts[0] if len(hub_parts) > 0 else "*",
-                hour=hub_parts[1] if len(hub_parts) > 1 else "*",
-                day=hub_parts[2] if len(hub_parts) > 2 else "*",
-                month=hub_parts[3] if len(hub_parts) > 3 else "*",
-                day_of_week=hub_parts[4] if len(hub_parts) > 4 else "*",
-                timezone=self.settings.scheduler.timezone,
+            hub_trigger = _build_trigger(
+                self.settings.hub.cron_expression,
+                self.settings.scheduler.timezone,
             )
 
             self._scheduler.add_job(
@@ -287,14 +272,9 @@ class ResearchRunner:
             )
 
         if self.settings.swarm.enabled:
-            swarm_parts = self.settings.swarm.cron_expression.split()
-            swarm_trigger = CronTrigger(
-                minute=swarm_parts[0] if len(swarm_parts) > 0 else "*",
-                hour=swarm_parts[1] if len(swarm_parts) > 1 else "*",
-                day=swarm_parts[2] if len(swarm_parts) > 2 else "*",
-                month=swarm_parts[3] if len(swarm_parts) > 3 else "*",
-                day_of_week=swarm_parts[4] if len(swarm_parts) > 4 else "*",
-                timezone=self.settings.scheduler.timezone,
+            swarm_trigger = _build_trigger(
+                self.settings.swarm.cron_expression,
+                self.settings.scheduler.timezone,
             )
 
             self._scheduler.add_job(
@@ -335,11 +315,14 @@ async def main():
 
     logger.info("Research scheduler running. Press Ctrl+C to exit.")
 
+    # Park until a shutdown signal arrives
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
     try:
-        # Keep running
-        while True:
-            await asyncio.sleep(3600)
-    except KeyboardInterrupt:
+        await stop.wait()
         logger.info("Shutting down...")
     finally:
         await runner.shutdown()
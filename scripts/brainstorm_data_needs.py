@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Agent brainstorm session to identify optimal data sources."""
 
+import argparse
 import asyncio
+import os
 import sys
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -68,12 +71,17 @@ Think beyond traditional sources. Consider:
 
 List your TOP 5 most impactful data sources, ranked by alpha potential."""
 
+RESULTS_PATH = Path("data/brainstorm_results.md")
+RESULTS_TTL_SECONDS = 24 * 60 * 60
 
-async def brainstorm_agent(client: anthropic.Anthropic, agent_id: str, agent_info: dict) -> str:
+PROMPTS = {agent_id: BRAINSTORM_PROMPT.format(**info) for agent_id, info in AGENTS.items()}
+
+
+async def brainstorm_agent(client: anthropic.AsyncAnthropic, agent_id: str) -> str:
     """Get data source recommendations from one agent."""
-    prompt = BRAINSTORM_PROMPT.format(**agent_info)
+    prompt = PROMPTS[agent_id]
 
-    response = client.messages.create(
+    response = await client.messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=2000,
         temperature=0.8,  # Higher creativity
@@ -83,24 +91,26 @@ async def brainstorm_agent(client: anthropic.Anthropic, agent_id: str, agent_inf
     return response.content[0].text
 
 
-async def run_brainstorm(api_key: str):
-    """Run brainstorm session with all agents."""
-    client = anthropic.Anthropic(api_key=api_key)
+async def _refresh_brainstorm(api_key: str) -> None:
+    """Run a fresh brainstorm session with all agents and save the results."""
+    client = anthropic.AsyncAnthropic(api_key=api_key)
 
     print("=" * 70)
     print("AGENT DATA SOURCE BRAINSTORM SESSION")
     print("=" * 70)
     print()
 
-    all_recommendations = {}
+    # Ask every agent at once; results come back in AGENTS order
+    responses = await asyncio.gather(
+        *(brainstorm_agent(client, agent_id) for agent_id in AGENTS)
+    )
+    all_recommendations = dict(zip(AGENTS, responses))
 
-    for agent_id, agent_info in AGENTS.items():
+    for agent_id, response in all_recommendations.items():
+        agent_info = AGENTS[agent_id]
         print(f"\n{'='*70}")
         print(f"Agent: {agent_info['name']} ({agent_info['focus']})")
         print("=" * 70)
-
-        response = await brainstorm_agent(client, agent_id, agent_info)
-        all_recommendations[agent_id] = response
         print(response)
         print()
 
@@ -109,11 +119,17 @@ async def run_brainstorm(api_key: str):
     print("SYNTHESIZING COMMON THEMES & PRIORITIES")
     print("=" * 70)
 
+    sections = [
+        f"### {AGENTS[aid]['name']} ({AGENTS[aid]['focus']}):\n{rec}"
+        for aid, rec in all_recommendations.items()
+    ]
+    recommendations_block = "\n".join(sections)
+
     synthesis_prompt = f"""You are the Chief Data Officer reviewing data source recommendations from 6 research analysts.
 
 Here are their recommendations:
 
-{chr(10).join(f"### {AGENTS[aid]['name']} ({AGENTS[aid]['focus']}):{chr(10)}{rec}" for aid, rec in all_recommendations.items())}
+{recommendations_block}
 
 ---
 
@@ -132,7 +148,7 @@ Synthesize these into:
 
 Be specific and actionable."""
 
-    synthesis = client.messages.create(
+    synthesis = await client.messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=3000,
         messages=[{"role": "user", "content": synthesis_prompt}]
@@ -140,30 +156,58 @@ Be specific and actionable."""
 
     print(synthesis.content[0].text)
 
-    # Save results
-    output_path = Path("data/brainstorm_results.md")
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Save results atomically so a failed run never clobbers the previous file
+    lines = ["# Agent Data Source Brainstorm Results\n\n"]
+    for agent_id, rec in all_recommendations.items():
+        lines.append(f"## {AGENTS[agent_id]['name']} ({AGENTS[agent_id]['focus']})\n\n")
+        lines.append(rec)
+        lines.append("\n\n---\n\n")
+    lines.append("## Synthesis\n\n")
+    lines.append(synthesis.content[0].text)
+
+    RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = RESULTS_PATH.with_suffix(".md.tmp")
+    tmp_path.write_text("".join(lines))
+    os.replace(tmp_path, RESULTS_PATH)
 
-    with open(output_path, "w") as f:
-        f.write("# Agent Data Source Brainstorm Results\n\n")
-        for agent_id, rec in all_recommendations.items():
-            f.write(f"## {AGENTS[agent_id]['name']} ({AGENTS[agent_id]['focus']})\n\n")
-            f.write(rec)
-            f.write("\n\n---\n\n")
-        f.write("## Synthesis\n\n")
-        f.write(synthesis.content[0].text)
+    print(f"\n\nResults saved to: {RESULTS_PATH}")
 
-    print(f"\n\nResults saved to: {output_path}")
+
+async def run_brainstorm(api_key: str, force: bool = False):
+    """Run brainstorm session, serving cached results while they are fresh.
+
+    Stale results are shown immediately and then refreshed; if the refresh
+    fails the stale file is left in place.
+    """
+    if force or not RESULTS_PATH.exists():
+        await _refresh_brainstorm(api_key)
+        return
+
+    age = time.time() - RESULTS_PATH.stat().st_mtime
+    print(RESULTS_PATH.read_text())
+
+    if age < RESULTS_TTL_SECONDS:
+        print(f"\n\nCached results from {RESULTS_PATH} ({age / 3600:.1f}h old)")
+        return
+
+    print(f"\n\nCached results are {age / 3600:.1f}h old; refreshing...")
+    try:
+        await _refresh_brainstorm(api_key)
+    except Exception as e:
+        print(f"Refresh failed, keeping cached results: {e}")
 
 
 def main():
-    import os
+    parser = argparse.ArgumentParser(description="Agent data source brainstorm")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached results")
+    args = parser.parse_args()
+
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
         print("Set ANTHROPIC_API_KEY environment variable")
         sys.exit(1)
 
-    asyncio.run(run_brainstorm(api_key))
+    asyncio.run(run_brainstorm(api_key, force=args.refresh))
 
 
 if __name__ == "__main__":
@@ -2,53 +2,207 @@
 """Build static HTML hub from daily JSON outputs."""
 
 import argparse
-import json
+import hashlib
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 try:
-    import markdown
-except ImportError as exc:
-    raise SystemExit("Missing dependency: markdown. Run `pip install markdown`.") from exc
+    from orjson import loads as _json_loads
+
+    _JSON_PARSES_BUFFERS = True
+except ImportError:
+    from json import loads as _json_loads
+
+    _JSON_PARSES_BUFFERS = False
+
+
+def _load_markdown_renderer() -> Tuple[str, Callable[[str], str]]:
+    """Pick the fastest installed markdown renderer (cmarkgfm > mistune > markdown)."""
+    try:
+        import cmarkgfm
+        from cmarkgfm.cmark import Options
+    except ImportError:
+        pass
+    else:
+        # UNSAFE keeps raw HTML in memos, matching the other renderers
+        return "cmarkgfm", partial(
+            cmarkgfm.github_flavored_markdown_to_html, options=Options.CMARK_OPT_UNSAFE
+        )
+
+    try:
+        import mistune
+    except ImportError:
+        pass
+    else:
+        return "mistune", mistune.create_markdown(escape=False)
+
+    try:
+        import markdown
+    except ImportError as exc:
+        raise SystemExit("Missing dependency: mistune. Run `pip install mistune`.") from exc
+    return "markdown", markdown.markdown
+
+
+_MARKDOWN_BACKEND, _render_markdown = _load_markdown_renderer()
+
+
+_REPORT_PREFIX = "landscape_"
+_REPORT_SUFFIX = ".json"
+
+
+def _report_dates(reports_dir: Path) -> Iterator[str]:
+    # Filenames are landscape_YYYY-MM-DD.json, so lexical order is chronological
+    with os.scandir(reports_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(_REPORT_PREFIX) and name.endswith(_REPORT_SUFFIX):
+                yield name[len(_REPORT_PREFIX):-len(_REPORT_SUFFIX)]
 
 
 def _find_latest_report(reports_dir: Path) -> str:
-    candidates = sorted(reports_dir.glob("landscape_*.json"))
-    if not candidates:
+    latest = max(_report_dates(reports_dir), default=None)
+    if latest is None:
         raise SystemExit("No landscape JSON files found. Run scripts/run_hub_daily.py first.")
-    latest = candidates[-1]
-    return latest.stem.replace("landscape_", "")
+    return latest
 
 
 def _find_previous_report(reports_dir: Path, report_date: str) -> Optional[str]:
-    candidates = sorted(reports_dir.glob("landscape_*.json"))
-    dates = [c.stem.replace("landscape_", "") for c in candidates]
-    if report_date not in dates:
-        return None
-    idx = dates.index(report_date)
-    if idx == 0:
-        return None
-    return dates[idx - 1]
-
-
-def _add_rank_deltas(current: List[Dict[str, Any]], previous: List[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
-    prev_rank = {item[key]: idx for idx, item in enumerate(previous, start=1)}
+    previous = None
+    found = False
+    for date in _report_dates(reports_dir):
+        if date == report_date:
+            found = True
+        elif date < report_date and (previous is None or date > previous):
+            previous = date
+    return previous if found else None
+
+
+def _rank_map(items: List[Dict[str, Any]], key: str) -> Dict[Any, int]:
+    return {item[key]: idx for idx, item in enumerate(items, start=1)}
+
+
+def _add_rank_deltas(
+    current: List[Dict[str, Any]], prev_rank: Dict[Any, int], key: str
+) -> List[Dict[str, Any]]:
+    get_prev = prev_rank.get
     updated = []
     for idx, item in enumerate(current, start=1):
-        delta = None
-        prev = prev_rank.get(item[key])
-        if prev is not None:
-            delta = prev - idx
-        updated.append({**item, "delta": delta})
+        prev = get_prev(item[key])
+        entry = item.copy()
+        entry["delta"] = prev - idx if prev is not None else None
+        updated.append(entry)
     return updated
 
 
+HUB_TEMPLATES = ("hub_memo.html.j2", "hub_index.html.j2")
+BYTECODE_CACHE_DIR = Path("data/.jinja_cache")
+
+
+@lru_cache(maxsize=4)
+def _get_env(templates_dir: str) -> Environment:
+    # Reused across builds so Jinja's compiled-template cache survives between calls;
+    # the bytecode cache carries compiled templates across short-lived processes
+    BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=FileSystemBytecodeCache(str(BYTECODE_CACHE_DIR)),
+    )
+    # Compile the hub templates up front so the first build pays no parse cost
+    for name in HUB_TEMPLATES:
+        env.get_template(name)
+    return env
+
+
+_MMAP_MIN_BYTES = 64 * 1024
+
+
 def _load_json(path: Path) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if not _JSON_PARSES_BUFFERS or size < _MMAP_MIN_BYTES:
+            return _json_loads(handle.read())
+        # Large landscapes are parsed straight from the page cache without a copy
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return _json_loads(view)
+
+
+_READ_CHUNK_SIZE = 64 * 1024
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def _read_memo_bytes(path: str) -> bytes:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if _HAS_FADVISE:
+            # Hint sequential access so cold-cache reads get aggressive readahead
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        chunks = []
+        while chunk := os.read(fd, _READ_CHUNK_SIZE):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+MARKDOWN_CACHE_DIR = Path("data/.markdown_cache")
+MARKDOWN_CACHE_MAX_ENTRIES = 512
+
+
+def _render_markdown_cached(raw: bytes) -> str:
+    # Unchanged memos map to the same key, so re-renders become a cache read
+    digest = hashlib.blake2b(raw, digest_size=16)
+    digest.update(_MARKDOWN_BACKEND.encode())
+    cache_path = MARKDOWN_CACHE_DIR / f"{digest.hexdigest()}.html"
+    try:
+        html = cache_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pass
+    else:
+        os.utime(cache_path)
+        return html
+
+    html = _render_markdown(raw.decode("utf-8"))
+    MARKDOWN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(html, encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+    return html
+
+
+def _prune_markdown_cache() -> None:
+    try:
+        entries = list(os.scandir(MARKDOWN_CACHE_DIR))
+    except FileNotFoundError:
+        return
+    if len(entries) <= MARKDOWN_CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[: len(entries) - MARKDOWN_CACHE_MAX_ENTRIES]:
+        try:
+            os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+
+
+def _render_memo_markdown(path: str) -> str:
+    try:
+        raw = _read_memo_bytes(path)
+    except FileNotFoundError:
+        return ""
+    return _render_markdown_cached(raw) if raw else ""
 
 
 def build_hub(report_date: str, reports_dir: Path, templates_dir: Path, output_dir: Path) -> None:
@@ -66,54 +220,57 @@ def build_hub(report_date: str, reports_dir: Path, templates_dir: Path, output_d
     top_companies = landscape.get("top_companies", [])
 
     if prev_landscape:
-        top_verticals = _add_rank_deltas(top_verticals, prev_landscape.get("top_verticals", []), "id")
-        top_aspects = _add_rank_deltas(top_aspects, prev_landscape.get("top_aspects", []), "id")
-        top_companies = _add_rank_deltas(top_companies, prev_landscape.get("top_companies", []), "ticker")
+        prev_vertical_rank = _rank_map(prev_landscape.get("top_verticals", []), "id")
+        prev_aspect_rank = _rank_map(prev_landscape.get("top_aspects", []), "id")
+        prev_company_rank = _rank_map(prev_landscape.get("top_companies", []), "ticker")
+        top_verticals = _add_rank_deltas(top_verticals, prev_vertical_rank, "id")
+        top_aspects = _add_rank_deltas(top_aspects, prev_aspect_rank, "id")
+        top_companies = _add_rank_deltas(top_companies, prev_company_rank, "ticker")
 
-    env = Environment(loader=FileSystemLoader(str(templates_dir)), autoescape=False)
+    env = _get_env(str(templates_dir))
 
     memo_dir = output_dir / "memos"
     memo_dir.mkdir(parents=True, exist_ok=True)
 
-    memo_entries = []
-    memo_template = env.get_template("hub_memo.html.j2")
-    for memo in memos.get("memos", []):
-        memo_md_path = Path(memo["path"])
-        memo_html = ""
-        if memo_md_path.exists():
-            memo_html = markdown.markdown(memo_md_path.read_text(encoding="utf-8"))
-        memo_output = memo_dir / f"{memo['theme_id']}_{report_date}.html"
-        memo_content = memo_template.render(
+    stream_memo = env.get_template("hub_memo.html.j2").stream
+
+    memo_dir_str = str(memo_dir)
+
+    def render_one(memo: Dict[str, Any]) -> Dict[str, Any]:
+        memo_name = f"{memo['theme_id']}_{report_date}.html"
+        # Stream encoded chunks straight to disk instead of building the page as text
+        stream_memo(
             theme_id=memo["theme_id"],
             date=report_date,
             aggregate_score=memo.get("aggregate_score", 0),
             top_companies=memo.get("top_companies", []),
-            memo_html=memo_html,
-        )
-        memo_output.write_text(memo_content, encoding="utf-8")
-        memo_entries.append({
+            memo_html=_render_memo_markdown(memo["path"]),
+        ).dump(os.path.join(memo_dir_str, memo_name), encoding="utf-8")
+        return {
             "theme_id": memo["theme_id"],
             "aggregate_score": memo.get("aggregate_score", 0),
             "summary": memo.get("summary", ""),
-            "link": f"memos/{memo_output.name}",
+            "link": f"memos/{memo_name}",
             "verticals": memo.get("verticals", []),
             "aspects": memo.get("aspects", []),
-        })
+        }
 
-    memo_entries.sort(key=lambda x: x["aggregate_score"], reverse=True)
+    # Memos are independent: read, convert, render and write each one in the pool
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        memo_entries = list(executor.map(render_one, memos.get("memos", [])))
+    _prune_markdown_cache()
 
-    index_template = env.get_template("hub_index.html.j2")
-    index_content = index_template.render(
+    memo_entries.sort(key=itemgetter("aggregate_score"), reverse=True)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    env.get_template("hub_index.html.j2").stream(
         report_date=report_date,
         memos=memo_entries,
         top_verticals=top_verticals,
         top_aspects=top_aspects,
         top_companies=top_companies,
         prev_date=prev_date,
-    )
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-    (output_dir / "index.html").write_text(index_content, encoding="utf-8")
+    ).dump(str(output_dir / "index.html"), encoding="utf-8")
 
 
 def main() -> None:
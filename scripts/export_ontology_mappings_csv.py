@@ -6,15 +6,19 @@ Usage:
 """
 
 import csv
-import json
 import os
 import sys
 from typing import Any, Dict, List
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    with open(path, "rb") as handle:
+        return _json_loads(handle.read())
 
 
 def write_csv(path: str, rows: List[Dict[str, Any]]) -> None:
@@ -22,9 +26,9 @@ def write_csv(path: str, rows: List[Dict[str, Any]]) -> None:
         return
     fieldnames = list(rows[0].keys())
     with open(path, "w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows(tuple(row.get(key, "") for key in fieldnames) for row in rows)
 
 
 def main() -> int:
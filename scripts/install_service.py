@@ -44,14 +44,6 @@ LAUNCHD_PLIST = """<?xml version="1.0" encoding="UTF-8"?>
 
     <key>StandardErrorPath</key>
     <string>{log_dir}/ai-research-stderr.log</string>
-
-    <key>StartCalendarInterval</key>
-    <dict>
-        <key>Hour</key>
-        <integer>6</integer>
-        <key>Minute</key>
-        <integer>0</integer>
-    </dict>
 </dict>
 </plist>
 """
@@ -105,6 +97,14 @@ def install_launchd(user_only: bool = True) -> bool:
 
         print(f"✓ Created plist: {plist_path}")
 
+        # Warm the template bytecode cache before the first scheduled run
+        subprocess.run(
+            [python_path, str(project_root / "scripts" / "precompile_templates.py")],
+            cwd=project_root,
+            check=True,
+        )
+        print("✓ Precompiled templates")
+
         # Load the service
         subprocess.run(["launchctl", "load", str(plist_path)], check=True)
         print("✓ Loaded service")
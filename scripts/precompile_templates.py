@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Warm the Jinja bytecode cache for the static hub templates."""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.build_hub import BYTECODE_CACHE_DIR, HUB_TEMPLATES, _get_env
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompile hub templates")
+    parser.add_argument(
+        "--templates-dir", default="src/reports/templates", help="Templates directory"
+    )
+
+    args = parser.parse_args()
+    _get_env(args.templates_dir)
+
+    print(f"Precompiled {len(HUB_TEMPLATES)} templates into {BYTECODE_CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
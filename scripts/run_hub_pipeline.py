@@ -5,7 +5,7 @@ import argparse
 import asyncio
 import logging
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -23,9 +23,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def main_async(top_themes: Optional[int], top_companies: Optional[int], include_memos: bool) -> int:
+async def main_async(
+    top_themes: Optional[int],
+    top_companies: Optional[int],
+    include_memos: bool,
+    report_date: Optional[str] = None,
+) -> int:
     settings = get_settings()
-    logger.info("Running hub pipeline")
+    # One date for the whole run so landscape files and the hub build always agree
+    date_str = report_date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    logger.info("Running hub pipeline for %s", date_str)
 
     outputs = await run_daily_landscape(
         mappings_path=settings.hub.mappings_path,
@@ -34,12 +41,12 @@ async def main_async(top_themes: Optional[int], top_companies: Optional[int], in
         top_themes=top_themes or settings.hub.top_themes,
         top_companies=top_companies or settings.hub.top_companies,
         include_memos=include_memos,
+        report_date=date_str,
     )
 
     logger.info("Hub pipeline outputs: %s", outputs)
 
     if settings.hub.build_static:
-        date_str = datetime.utcnow().strftime("%Y-%m-%d")
         build_hub(
             report_date=date_str,
             reports_dir=settings.hub.output_dir,
@@ -56,6 +63,7 @@ def main() -> None:
     parser.add_argument("--top-themes", type=int, default=None, help="Top themes to memo")
     parser.add_argument("--top-companies", type=int, default=None, help="Top companies to rank")
     parser.add_argument("--skip-memos", action="store_true", help="Skip memo generation")
+    parser.add_argument("--date", default=None, help="Report date YYYY-MM-DD (default: today, UTC)")
 
     args = parser.parse_args()
     exit_code = asyncio.run(
@@ -63,6 +71,7 @@ def main() -> None:
             top_themes=args.top_themes,
             top_companies=args.top_companies,
             include_memos=not args.skip_memos,
+            report_date=args.date,
         )
     )
     raise SystemExit(exit_code)
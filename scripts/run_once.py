@@ -10,9 +10,11 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import httpx
+
 from config.settings import get_settings
 from src.agents.registry import AgentRegistry
-from src.data_sources.registry import create_default_registry
+from src.data_sources.registry import get_data_registry
 from src.notifications.discord_notifier import DiscordNotifier
 from src.notifications.email_notifier import EmailNotifier
 from src.notifications.slack_notifier import SlackNotifier
@@ -27,6 +29,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_RULE = "=" * 60
+
 
 async def run_once(
     skip_notifications: bool = False,
@@ -46,9 +50,9 @@ async def run_once(
 
     settings = get_settings()
 
-    logger.info("=" * 60)
+    logger.info(_RULE)
     logger.info("AI Equity Research - Single Run")
-    logger.info("=" * 60)
+    logger.info(_RULE)
 
     # Initialize database
     database = ResearchDatabase(settings.database.path)
@@ -57,29 +61,7 @@ async def run_once(
 
     # Initialize data sources
     logger.info("Initializing data sources...")
-    data_registry = create_default_registry(
-        news_api_key=(
-            settings.data_sources.news_api_key.get_secret_value()
-            if settings.data_sources.news_api_key
-            else None
-        ),
-        alpha_vantage_key=(
-            settings.data_sources.alpha_vantage_key.get_secret_value()
-            if settings.data_sources.alpha_vantage_key
-            else None
-        ),
-        sec_user_agent=settings.data_sources.sec_user_agent,
-        fred_api_key=(
-            settings.data_sources.fred_api_key.get_secret_value()
-            if settings.data_sources.fred_api_key
-            else None
-        ),
-        github_token=(
-            settings.data_sources.github_token.get_secret_value()
-            if settings.data_sources.github_token
-            else None
-        ),
-    )
+    data_registry = get_data_registry(settings.data_sources)
 
     # Initialize agent registry
     agent_registry = AgentRegistry(settings.prompts_path)
@@ -110,24 +92,24 @@ async def run_once(
         summary = report_generator.generate_summary(run)
 
         # Print results
-        logger.info("=" * 60)
+        logger.info(_RULE)
         logger.info("RESULTS")
-        logger.info("=" * 60)
-        logger.info(f"Run ID: {run.run_id}")
-        logger.info(f"Status: {run.status}")
-        logger.info(f"Loops: {len(run.iterations)}")
-        logger.info(f"Convergence: {run.convergence_result.get('reason', 'N/A')}")
-        logger.info(f"Duration: {run.total_duration_seconds:.1f}s")
-        logger.info(f"Tokens: {run.total_tokens}")
+        logger.info(_RULE)
+        logger.info("Run ID: %s", run.run_id)
+        logger.info("Status: %s", run.status)
+        logger.info("Loops: %d", len(run.iterations))
+        logger.info("Convergence: %s", run.convergence_result.get("reason", "N/A"))
+        logger.info("Duration: %.1fs", run.total_duration_seconds)
+        logger.info("Tokens: %s", run.total_tokens)
         logger.info("")
         logger.info("TOP 3 PICKS:")
         for i, pick in enumerate(run.final_picks[:3], 1):
             ticker = pick.get("ticker", "N/A")
             company = pick.get("company_name", "Unknown")
             conviction = pick.get("conviction_score", 0)
-            logger.info(f"  {i}. {ticker} - {company} ({conviction:.0f}%)")
+            logger.info("  %d. %s - %s (%.0f%%)", i, ticker, company, conviction)
         logger.info("")
-        logger.info(f"Report saved: {report_path}")
+        logger.info("Report saved: %s", report_path)
 
         # Send notifications if not skipped
         if not skip_notifications:
@@ -143,7 +125,7 @@ async def run_once(
         return 0
 
     except Exception as e:
-        logger.error(f"Research failed: {e}")
+        logger.error("Research failed: %s", e)
         import traceback
         traceback.print_exc()
         return 1
@@ -160,25 +142,26 @@ async def _send_notifications(
     report_path: str,
 ) -> None:
     """Send notifications."""
-    tasks = []
-
     email = EmailNotifier(settings.notifications)
-    if email.is_enabled:
-        tasks.append(email.send_research_complete(run_id, summary, report_path))
-
     slack = SlackNotifier(settings.notifications)
-    if slack.is_enabled:
-        tasks.append(slack.send_research_complete(run_id, summary, picks))
-
     discord = DiscordNotifier(settings.notifications)
-    if discord.is_enabled:
-        tasks.append(discord.send_research_complete(run_id, summary, picks))
 
-    if tasks:
+    # Slack and Discord share one HTTP client so their webhooks reuse connections
+    async with httpx.AsyncClient() as client:
+        tasks = []
+        if email.is_enabled:
+            tasks.append(email.send_research_complete(run_id, summary, report_path))
+        if slack.is_enabled:
+            tasks.append(slack.send_research_complete(run_id, summary, picks, client=client))
+        if discord.is_enabled:
+            tasks.append(discord.send_research_complete(run_id, summary, picks, client=client))
+
+        # A failing notifier is logged and doesn't cancel the others
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        for r in results:
-            if isinstance(r, Exception):
-                logger.warning(f"Notification failed: {r}")
+
+    for r in results:
+        if isinstance(r, Exception):
+            logger.warning("Notification failed: %s", r)
 
 
 def main():
@@ -3,8 +3,11 @@
 
 import asyncio
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
+import httpx
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.data_sources.stocktwits import StockTwitsDataSource
@@ -16,193 +19,222 @@ from src.data_sources.earnings_calendar import EarningsCalendarDataSource
 from src.data_sources.fintwit import FinTwitDataSource
 
 
-async def test_stocktwits():
+@contextmanager
+def _buffered_output():
+    """Collect a test's lines and write them in one go so concurrent tests don't interleave."""
+    lines = []
+    try:
+        yield lines.append
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def test_stocktwits(transport: httpx.AsyncBaseTransport):
     """Test StockTwits data source."""
-    print("\n" + "=" * 50)
-    print("Testing StockTwits...")
-    print("=" * 50)
+    with _buffered_output() as emit:
+        emit("\n" + "=" * 50)
+        emit("Testing StockTwits...")
+        emit("=" * 50)
 
-    source = StockTwitsDataSource()
-    await source.initialize()
+        source = StockTwitsDataSource()
+        await source.initialize(transport=transport)
 
-    result = await source.fetch("NVDA")
-    print(f"Ticker: NVDA")
-    print(f"Quality: {result.quality}")
+        result = await source.fetch("NVDA")
+        emit(f"Ticker: NVDA")
+        emit(f"Quality: {result.quality}")
 
-    if result.data:
-        sentiment = result.data.get("sentiment", {})
-        print(f"Sentiment Score: {sentiment.get('score', 'N/A')}")
-        print(f"Bullish: {sentiment.get('bullish_count', 0)}")
-        print(f"Bearish: {sentiment.get('bearish_count', 0)}")
-        print(f"Summary: {result.data.get('summary', 'N/A')}")
+        if result.data:
+            sentiment = result.data.get("sentiment", {})
+            emit(f"Sentiment Score: {sentiment.get('score', 'N/A')}")
+            emit(f"Bullish: {sentiment.get('bullish_count', 0)}")
+            emit(f"Bearish: {sentiment.get('bearish_count', 0)}")
+            emit(f"Summary: {result.data.get('summary', 'N/A')}")
 
-    await source.close()
-    return result.error is None
+        await source.close()
+        return result.error is None
 
 
-async def test_reddit():
+async def test_reddit(transport: httpx.AsyncBaseTransport):
     """Test Reddit sentiment data source."""
-    print("\n" + "=" * 50)
-    print("Testing Reddit Sentiment...")
-    print("=" * 50)
+    with _buffered_output() as emit:
+        emit("\n" + "=" * 50)
+        emit("Testing Reddit Sentiment...")
+        emit("=" * 50)
 
-    source = RedditSentimentDataSource()
-    await source.initialize()
+        source = RedditSentimentDataSource()
+        await source.initialize(transport=transport)
 
-    result = await source.fetch("NVDA", subreddits=["wallstreetbets", "stocks"])
-    print(f"Ticker: NVDA")
-    print(f"Quality: {result.quality}")
+        result = await source.fetch("NVDA", subreddits=["wallstreetbets", "stocks"])
+        emit(f"Ticker: NVDA")
+        emit(f"Quality: {result.quality}")
 
-    if result.data:
-        metrics = result.data.get("metrics", {})
-        print(f"Mention Count: {metrics.get('mention_count', 0)}")
-        print(f"Total Upvotes: {metrics.get('total_upvotes', 0)}")
-        sentiment = result.data.get("sentiment", {})
-        print(f"Sentiment: {sentiment.get('label', 'N/A')} ({sentiment.get('score', 0):.1f})")
-        print(f"Summary: {result.data.get('summary', 'N/A')}")
+        if result.data:
+            metrics = result.data.get("metrics", {})
+            emit(f"Mention Count: {metrics.get('mention_count', 0)}")
+            emit(f"Total Upvotes: {metrics.get('total_upvotes', 0)}")
+            sentiment = result.data.get("sentiment", {})
+            emit(f"Sentiment: {sentiment.get('label', 'N/A')} ({sentiment.get('score', 0):.1f})")
+            emit(f"Summary: {result.data.get('summary', 'N/A')}")
 
-    # Test trending
-    trending = await source.get_trending_tickers("wallstreetbets")
-    print(f"\nTrending on WSB: {[t['ticker'] for t in trending[:5]]}")
+        # Test trending
+        trending = await source.get_trending_tickers("wallstreetbets")
+        emit(f"\nTrending on WSB: {[t['ticker'] for t in trending[:5]]}")
 
-    await source.close()
-    return result.error is None
+        await source.close()
+        return result.error is None
 
 
-async def test_github():
+async def test_github(transport: httpx.AsyncBaseTransport):
     """Test GitHub tracker data source."""
-    print("\n" + "=" * 50)
-    print("Testing GitHub Tracker...")
-    print("=" * 50)
+    with _buffered_output() as emit:
+        emit("\n" + "=" * 50)
+        emit("Testing GitHub Tracker...")
+        emit("=" * 50)
 
-    source = GitHubTrackerDataSource()
-    await source.initialize()
+        source = GitHubTrackerDataSource()
+        await source.initialize(transport=transport)
 
-    result = await source.fetch("NVDA")
-    print(f"Ticker: NVDA")
-    print(f"Quality: {result.quality}")
+        result = await source.fetch("NVDA")
+        emit(f"Ticker: NVDA")
+        emit(f"Quality: {result.quality}")
 
-    if result.data:
-        metrics = result.data.get("summary_metrics", {})
-        print(f"Tracked Repos: {metrics.get('tracked_repos', 0)}")
-        print(f"Total Stars: {metrics.get('total_stars', 0):,}")
-        print(f"Recent Commits: {metrics.get('commits_last_month', 0)}")
-        print(f"Summary: {result.data.get('summary', 'N/A')}")
+        if result.data:
+            metrics = result.data.get("summary_metrics", {})
+            emit(f"Tracked Repos: {metrics.get('tracked_repos', 0)}")
+            emit(f"Total Stars: {metrics.get('total_stars', 0):,}")
+            emit(f"Recent Commits: {metrics.get('commits_last_month', 0)}")
+            emit(f"Summary: {result.data.get('summary', 'N/A')}")
 
-    # Test trending AI repos
-    trending = await source.get_trending_ai_repos(days=7)
-    print(f"\nTrending AI repos: {[r['repo'] for r in trending[:3]]}")
+        # Test trending AI repos
+        trending = await source.get_trending_ai_repos(days=7)
+        emit(f"\nTrending AI repos: {[r['repo'] for r in trending[:3]]}")
 
-    await source.close()
-    return result.error is None
+        await source.close()
+        return result.error is None
 
 
-async def test_sec_insider():
+async def test_sec_insider(transport: httpx.AsyncBaseTransport):
     """Test SEC insider trading data source."""
-    print("\n" + "=" * 50)
-    print("Testing SEC Insider Trading...")
-    print("=" * 50)
+    with _buffered_output() as emit:
+        emit("\n" + "=" * 50)
+        emit("Testing SEC Insider Trading...")
+        emit("=" * 50)
 
-    source = SECInsiderDataSource()
-    await source.initialize()
+        source = SECInsiderDataSource()
+        await source.initialize(transport=transport)
 
-    result = await source.fetch("NVDA", days_back=90)
-    print(f"Ticker: NVDA")
-    print(f"Quality: {result.quality}")
+        result = await source.fetch("NVDA", days_back=90)
+        emit(f"Ticker: NVDA")
+        emit(f"Quality: {result.quality}")
 
-    if result.data:
-        analysis = result.data.get("analysis", {})
-        print(f"Total Filings: {analysis.get('total_filings', 0)}")
-        print(f"Buy Transactions: {analysis.get('buy_transactions', 0)}")
-        print(f"Sell Transactions: {analysis.get('sell_transactions', 0)}")
-        print(f"Signal: {analysis.get('signal', 'N/A')}")
-        print(f"Summary: {result.data.get('summary', 'N/A')}")
+        if result.data:
+            analysis = result.data.get("analysis", {})
+            emit(f"Total Filings: {analysis.get('total_filings', 0)}")
+            emit(f"Buy Transactions: {analysis.get('buy_transactions', 0)}")
+            emit(f"Sell Transactions: {analysis.get('sell_transactions', 0)}")
+            emit(f"Signal: {analysis.get('signal', 'N/A')}")
+            emit(f"Summary: {result.data.get('summary', 'N/A')}")
 
-    await source.close()
-    return True  # SEC can have issues, don't fail test
+        await source.close()
+        return True  # SEC can have issues, don't fail test
 
 
-async def test_rss_news():
+async def test_rss_news(transport: httpx.AsyncBaseTransport):
     """Test RSS news aggregator."""
-    print("\n" + "=" * 50)
-    print("Testing RSS News Aggregator...")
-    print("=" * 50)
+    with _buffered_output() as emit:
+        emit("\n" + "=" * 50)
+        emit("Testing RSS News Aggregator...")
+        emit("=" * 50)
 
-    source = RSSNewsDataSource()
-    await source.initialize()
+        source = RSSNewsDataSource()
+        await source.initialize(transport=transport)
 
-    result = await source.fetch("NVDA")
-    print(f"Ticker: NVDA")
-    print(f"Quality: {result.quality}")
+        result = await source.fetch("NVDA")
+        emit(f"Ticker: NVDA")
+        emit(f"Quality: {result.quality}")
 
-    if result.data:
-        print(f"Article Count: {result.data.get('article_count', 0)}")
-        articles = result.data.get("articles", [])
-        if articles:
-            print(f"Latest: {articles[0].get('title', 'N/A')[:60]}...")
-        print(f"Summary: {result.data.get('summary', 'N/A')}")
+        if result.data:
+            emit(f"Article Count: {result.data.get('article_count', 0)}")
+            articles = result.data.get("articles", [])
+            if articles:
+                emit(f"Latest: {articles[0].get('title', 'N/A')[:60]}...")
+            emit(f"Summary: {result.data.get('summary', 'N/A')}")
 
-    # Test market headlines
-    headlines = await source.get_market_headlines(max_articles=5)
-    print(f"\nMarket Headlines: {len(headlines)} articles")
+        # Test market headlines
+        headlines = await source.get_market_headlines(max_articles=5)
+        emit(f"\nMarket Headlines: {len(headlines)} articles")
 
-    await source.close()
-    return result.error is None
+        await source.close()
+        return result.error is None
 
 
-async def test_earnings():
+async def test_earnings(transport: httpx.AsyncBaseTransport):
     """Test earnings calendar data source."""
-    print("\n" + "=" * 50)
-    print("Testing Earnings Calendar...")
-    print("=" * 50)
+    with _buffered_output() as emit:
+        emit("\n" + "=" * 50)
+        emit("Testing Earnings Calendar...")
+        emit("=" * 50)
 
-    source = EarningsCalendarDataSource()
-    await source.initialize()
+        source = EarningsCalendarDataSource()
+        await source.initialize(transport=transport)
 
-    result = await source.fetch("NVDA")
-    print(f"Ticker: NVDA")
-    print(f"Quality: {result.quality}")
+        result = await source.fetch("NVDA")
+        emit(f"Ticker: NVDA")
+        emit(f"Quality: {result.quality}")
 
-    if result.data:
-        next_earnings = result.data.get("next_earnings", {})
-        print(f"Next Earnings: {next_earnings.get('date', 'N/A')}")
-        analysis = result.data.get("analysis", {})
-        print(f"Beat Rate: {analysis.get('beat_rate', 'N/A')}%")
-        print(f"Consistency: {analysis.get('consistency', 'N/A')}")
-        print(f"Summary: {result.data.get('summary', 'N/A')}")
+        if result.data:
+            next_earnings = result.data.get("next_earnings", {})
+            emit(f"Next Earnings: {next_earnings.get('date', 'N/A')}")
+            analysis = result.data.get("analysis", {})
+            emit(f"Beat Rate: {analysis.get('beat_rate', 'N/A')}%")
+            emit(f"Consistency: {analysis.get('consistency', 'N/A')}")
+            emit(f"Summary: {result.data.get('summary', 'N/A')}")
 
-    await source.close()
-    return result.error is None
+        await source.close()
+        return result.error is None
 
 
-async def test_fintwit():
+async def test_fintwit(transport: httpx.AsyncBaseTransport):
     """Test FinTwit data source."""
-    print("\n" + "=" * 50)
-    print("Testing FinTwit (Nitter)...")
-    print("=" * 50)
-
-    source = FinTwitDataSource()
-    await source.initialize()
-    print(f"Working instance: {source._working_instance}")
-
-    result = await source.fetch("NVDA")
-    print(f"Ticker: NVDA")
-    print(f"Quality: {result.quality}")
-
-    if result.data:
-        if "status" in result.data and result.data["status"] == "nitter_unavailable":
-            print("Fallback mode active (Nitter instances down)")
-            print(f"Manual check URLs provided: {len(result.data.get('manual_check_urls', {}))}")
-            print(f"Recommended accounts: {result.data.get('recommended_accounts', [])[:5]}")
-        else:
-            metrics = result.data.get("metrics", {})
-            print(f"Tweets found: {metrics.get('total_tweets', 0)}")
-            sentiment = result.data.get("sentiment", {})
-            print(f"Sentiment: {sentiment.get('label', 'N/A')} ({sentiment.get('score', 0):.1f})")
-        print(f"Summary: {result.data.get('summary', 'N/A')}")
+    with _buffered_output() as emit:
+        emit("\n" + "=" * 50)
+        emit("Testing FinTwit (Nitter)...")
+        emit("=" * 50)
+
+        source = FinTwitDataSource()
+        await source.initialize(transport=transport)
+        emit(f"Working instance: {source._working_instance}")
 
-    await source.close()
-    return True  # FinTwit in fallback mode is still valid
+        result = await source.fetch("NVDA")
+        emit(f"Ticker: NVDA")
+        emit(f"Quality: {result.quality}")
+
+        if result.data:
+            if "status" in result.data and result.data["status"] == "nitter_unavailable":
+                emit("Fallback mode active (Nitter instances down)")
+                emit(f"Manual check URLs provided: {len(result.data.get('manual_check_urls', {}))}")
+                emit(f"Recommended accounts: {result.data.get('recommended_accounts', [])[:5]}")
+            else:
+                metrics = result.data.get("metrics", {})
+                emit(f"Tweets found: {metrics.get('total_tweets', 0)}")
+                sentiment = result.data.get("sentiment", {})
+                emit(
+                    f"Sentiment: {sentiment.get('label', 'N/A')} "
+                    f"({sentiment.get('score', 0):.1f})"
+                )
+            emit(f"Summary: {result.data.get('summary', 'N/A')}")
+
+        await source.close()
+        return True  # FinTwit in fallback mode is still valid
+
+
+MAX_CONCURRENT_TESTS = 4
+
+
+async def _run_bounded(semaphore: asyncio.Semaphore, coro):
+    """Run a test coroutine once a concurrency slot is free."""
+    async with semaphore:
+        return await coro
 
 
 async def main():
@@ -211,16 +243,34 @@ async def main():
     print("TESTING NEW DATA SOURCES")
     print("=" * 60)
 
-    results = {}
+    # One connection pool for every source so keep-alive connections and TLS
+    # sessions are reused; each source still applies its own headers and timeouts
+    async with httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=32)) as transport:
+        tests = {
+            "StockTwits": test_stocktwits(transport),
+            "Reddit": test_reddit(transport),
+            "GitHub": test_github(transport),
+            "SEC Insider": test_sec_insider(transport),
+            "RSS News": test_rss_news(transport),
+            "Earnings": test_earnings(transport),
+            "FinTwit": test_fintwit(transport),
+        }
+
+        # Sources hit independent endpoints; cap how many run at once so their
+        # internal fan-out doesn't turn into a connection storm
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
+        outcomes = await asyncio.gather(
+            *(_run_bounded(semaphore, coro) for coro in tests.values()),
+            return_exceptions=True,
+        )
 
-    # Test each source
-    results["StockTwits"] = await test_stocktwits()
-    results["Reddit"] = await test_reddit()
-    results["GitHub"] = await test_github()
-    results["SEC Insider"] = await test_sec_insider()
-    results["RSS News"] = await test_rss_news()
-    results["Earnings"] = await test_earnings()
-    results["FinTwit"] = await test_fintwit()
+    results = {}
+    for name, outcome in zip(tests, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"\n{name} raised: {outcome!r}")
+            results[name] = False
+        else:
+            results[name] = outcome
 
     # Summary
     print("\n" + "=" * 60)
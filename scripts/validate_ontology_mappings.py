@@ -5,33 +5,97 @@ Usage:
   python scripts/validate_ontology_mappings.py docs/spec/ONTOLOGY_MAPPINGS.json
 """
 
-import json
+import os
 import re
 import sys
-from typing import Any, Dict, List
+from functools import partial
+from itertools import filterfalse
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 ID_PATTERNS = {
-    "theme": re.compile(r"^THM-[a-z0-9-]+$"),
-    "vertical": re.compile(r"^VRT-[a-z0-9-]+$"),
-    "aspect": re.compile(r"^ASP-[a-z0-9-]+$"),
-    "company": re.compile(r"^CMP-[A-Z0-9-]+$"),
+    "theme": re.compile(r"THM-[a-z0-9-]+"),
+    "vertical": re.compile(r"VRT-[a-z0-9-]+"),
+    "aspect": re.compile(r"ASP-[a-z0-9-]+"),
+    "company": re.compile(r"CMP-[A-Z0-9-]+"),
+}
+
+# table -> ({reference column: id_sets key}, column that must lie in [0, 1])
+TABLE_CHECKS = {
+    "theme_vertical_aspect": (
+        {"theme_id": "themes", "vertical_id": "verticals", "aspect_id": "aspects"},
+        None,
+    ),
+    "theme_company_exposure": (
+        {"theme_id": "themes", "company_id": "companies"},
+        "exposure_strength",
+    ),
+    "vertical_company_exposure": (
+        {"vertical_id": "verticals", "company_id": "companies"},
+        "exposure_strength",
+    ),
+    "aspect_theme_weighting": ({"aspect_id": "aspects", "theme_id": "themes"}, "weight"),
 }
 
+# Files at least this large are streamed with ijson (when installed) instead of
+# loaded whole; streaming re-reads the file once per table, so it only pays off
+# once the parsed document would not comfortably fit in memory
+STREAM_THRESHOLD_BYTES = 256 * 1024 * 1024
+
 
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    with open(path, "rb") as handle:
+        return _json_loads(handle.read())
+
 
+def stream_id_sets(path: str) -> Dict[str, List[str]]:
+    with open(path, "rb") as handle:
+        return next(ijson.items(handle, "id_sets"), {})
 
-def assert_in_range(value: float, name: str) -> None:
-    if not (0.0 <= value <= 1.0):
-        raise ValueError(f"{name} must be between 0 and 1, got {value}")
+
+def stream_rows(path: str, table: str) -> Iterator[Dict[str, Any]]:
+    # One sequential pass per table; only the current row is held in memory
+    with open(path, "rb") as handle:
+        yield from ijson.items(handle, f"{table}.item", use_float=True)
+
+
+def check_table(
+    rows: Iterable[Dict[str, Any]],
+    table: str,
+    refs: Dict[str, Set[str]],
+    range_field: Optional[str],
+) -> None:
+    seen: Dict[str, Set[str]] = {field: set() for field in refs}
+    out_of_range = []
+    for row in rows:
+        for field, values in seen.items():
+            values.add(row[field])
+        if range_field is not None and not 0.0 <= row[range_field] <= 1.0:
+            out_of_range.append(row[range_field])
+
+    # Set difference runs in C and reports every offender at once
+    for field, known in refs.items():
+        missing = seen[field] - known
+        if missing:
+            raise ValueError(f"Unknown {field}s in {table}: {sorted(missing)}")
+    if out_of_range:
+        raise ValueError(f"{range_field} in {table} must be between 0 and 1, got {out_of_range}")
 
 
 def check_ids(id_list: List[str], pattern: re.Pattern, label: str) -> None:
-    for item in id_list:
-        if not pattern.match(item):
-            raise ValueError(f"Invalid {label} id: {item}")
+    # Patterns are unanchored and applied with fullmatch, driven from C by filterfalse
+    bad = list(filterfalse(pattern.fullmatch, id_list))
+    if bad:
+        raise ValueError(f"Invalid {label} ids: {bad}")
 
 
 def main() -> int:
@@ -39,47 +103,30 @@ def main() -> int:
         print("Usage: python scripts/validate_ontology_mappings.py <path>")
         return 2
 
-    data = load_json(sys.argv[1])
-    id_sets = data.get("id_sets", {})
+    path = sys.argv[1]
+    if ijson is not None and os.path.getsize(path) >= STREAM_THRESHOLD_BYTES:
+        id_sets = stream_id_sets(path)
+        rows_for = partial(stream_rows, path)
+    else:
+        data = load_json(path)
+        id_sets = data.get("id_sets", {})
+
+        def rows_for(table: str) -> List[Dict[str, Any]]:
+            return data.get(table, [])
 
     check_ids(id_sets.get("themes", []), ID_PATTERNS["theme"], "theme")
     check_ids(id_sets.get("verticals", []), ID_PATTERNS["vertical"], "vertical")
     check_ids(id_sets.get("aspects", []), ID_PATTERNS["aspect"], "aspect")
     check_ids(id_sets.get("companies", []), ID_PATTERNS["company"], "company")
 
-    theme_ids = set(id_sets.get("themes", []))
-    vertical_ids = set(id_sets.get("verticals", []))
-    aspect_ids = set(id_sets.get("aspects", []))
-    company_ids = set(id_sets.get("companies", []))
-
-    for row in data.get("theme_vertical_aspect", []):
-        if row["theme_id"] not in theme_ids:
-            raise ValueError(f"Unknown theme_id in theme_vertical_aspect: {row['theme_id']}")
-        if row["vertical_id"] not in vertical_ids:
-            raise ValueError(f"Unknown vertical_id in theme_vertical_aspect: {row['vertical_id']}")
-        if row["aspect_id"] not in aspect_ids:
-            raise ValueError(f"Unknown aspect_id in theme_vertical_aspect: {row['aspect_id']}")
-
-    for row in data.get("theme_company_exposure", []):
-        if row["theme_id"] not in theme_ids:
-            raise ValueError(f"Unknown theme_id in theme_company_exposure: {row['theme_id']}")
-        if row["company_id"] not in company_ids:
-            raise ValueError(f"Unknown company_id in theme_company_exposure: {row['company_id']}")
-        assert_in_range(row["exposure_strength"], "exposure_strength")
-
-    for row in data.get("vertical_company_exposure", []):
-        if row["vertical_id"] not in vertical_ids:
-            raise ValueError(f"Unknown vertical_id in vertical_company_exposure: {row['vertical_id']}")
-        if row["company_id"] not in company_ids:
-            raise ValueError(f"Unknown company_id in vertical_company_exposure: {row['company_id']}")
-        assert_in_range(row["exposure_strength"], "exposure_strength")
-
-    for row in data.get("aspect_theme_weighting", []):
-        if row["aspect_id"] not in aspect_ids:
-            raise ValueError(f"Unknown aspect_id in aspect_theme_weighting: {row['aspect_id']}")
-        if row["theme_id"] not in theme_ids:
-            raise ValueError(f"Unknown theme_id in aspect_theme_weighting: {row['theme_id']}")
-        assert_in_range(row["weight"], "weight")
+    known_ids = {
+        key: set(id_sets.get(key, []))
+        for key in ("themes", "verticals", "aspects", "companies")
+    }
+
+    for table, (ref_columns, range_field) in TABLE_CHECKS.items():
+        refs = {field: known_ids[key] for field, key in ref_columns.items()}
+        check_table(rows_for(table), table, refs, range_field)
 
     print("Ontology mappings validation: OK")
     return 0
@@ -1,12 +1,15 @@
 """Base class for all research agents."""
 
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache, partial
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+_utc_now = partial(datetime.now, timezone.utc)  # utcnow() is deprecated and returns naive datetimes
+
 
 class AgentLayer(Enum):
     """Agent layer classification."""
@@ -23,6 +26,10 @@ class AgentLayer(Enum):
 class StockPick(BaseModel):
     """A single stock pick with analysis."""
 
+    # model_dump() result, reused by every layer that serializes this pick. A
+    # plain slot, so equality, pickling and model_copy ignore it
+    __slots__ = ("_dump_cache",)
+
     ticker: str = Field(..., description="Stock ticker symbol")
     company_name: str = Field(..., description="Company name")
     conviction_score: float = Field(..., ge=0, le=100, description="Conviction score 0-100")
@@ -39,14 +46,31 @@ class StockPick(BaseModel):
     position_size_recommendation: Optional[float] = Field(None, description="Position size 1-5%")
     bear_case: Optional[str] = Field(None, description="Bear case scenario")
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        object.__setattr__(self, "_dump_cache", None)
+
+    def cached_dump(self) -> dict[str, Any]:
+        """model_dump() computed once per pick; treat the result as read-only."""
+        dump = getattr(self, "_dump_cache", None)
+        if dump is None:
+            dump = self.model_dump()
+            object.__setattr__(self, "_dump_cache", dump)
+        return dump
+
 
 class AgentOutput(BaseModel):
     """Output from an agent's analysis."""
 
+    # Built in bulk every loop: the empty __slots__ drops the per-instance
+    # __weakref__ slot. Pydantic keeps field values in its own __dict__ slot,
+    # so that part cannot be removed
+    __slots__ = ()
+
     agent_id: str = Field(..., description="Agent identifier")
     agent_name: str = Field(..., description="Agent display name")
     layer: AgentLayer = Field(..., description="Agent layer")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utc_now)
     picks: list[StockPick] = Field(default_factory=list, description="Stock picks")
     reasoning: str = Field("", description="Overall reasoning")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
@@ -69,7 +93,7 @@ class CEOOutput(BaseModel):
     agent_id: str = "ceo"
     agent_name: str = "Robert Hayes"
     layer: AgentLayer = AgentLayer.LAYER4_CEO
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utc_now)
     decisions: list[CEODecision] = Field(default_factory=list)
     final_top3: list[StockPick] = Field(default_factory=list)
     stability_score: float = Field(..., description="0-1 score of how stable picks are")
@@ -79,6 +103,9 @@ class CEOOutput(BaseModel):
 class HierarchicalTask(BaseModel):
     """A task in the hierarchical agent flow."""
 
+    # No __weakref__ slot, as on AgentOutput
+    __slots__ = ()
+
     task_id: str = Field(..., description="Unique task identifier")
     component: str = Field(..., description="Parent component")
     description: str = Field(..., description="Task description")
@@ -90,6 +117,9 @@ class HierarchicalTask(BaseModel):
 class HierarchicalArtifact(BaseModel):
     """Output artifact from a hierarchical worker."""
 
+    # No __weakref__ slot, as on AgentOutput
+    __slots__ = ()
+
     task_id: str = Field(..., description="Task this artifact is for")
     worker_id: str = Field(..., description="Worker that produced this")
     content: dict[str, Any] = Field(..., description="Artifact content")
@@ -106,9 +136,16 @@ class JudgeEvaluation(BaseModel):
     recommendations: list[str] = Field(default_factory=list, description="Recommendations")
 
 
+@lru_cache(maxsize=1)
+def _agent_output_schema() -> dict[str, Any]:
+    return AgentOutput.model_json_schema()
+
+
 class BaseResearchAgent(ABC):
     """Abstract base class for all research agents."""
 
+    __slots__ = ("agent_id", "name", "layer", "system_prompt")
+
     def __init__(
         self,
         agent_id: str,
@@ -147,13 +184,18 @@ class BaseResearchAgent(ABC):
         pass
 
     def get_output_schema(self) -> dict[str, Any]:
-        """Get the JSON schema for this agent's output."""
-        return AgentOutput.model_json_schema()
+        """Get the JSON schema for this agent's output.
+
+        The schema is generated once and shared; treat it as read-only.
+        """
+        return _agent_output_schema()
 
 
 class Layer1Agent(BaseResearchAgent):
     """Base class for Layer 1 primary research analysts."""
 
+    __slots__ = ("sectors",)
+
     def __init__(
         self,
         agent_id: str,
@@ -173,6 +215,8 @@ class Layer1Agent(BaseResearchAgent):
 class Layer2Agent(BaseResearchAgent):
     """Base class for Layer 2 secondary analysts."""
 
+    __slots__ = ("specialties",)
+
     def __init__(
         self,
         agent_id: str,
@@ -188,10 +232,24 @@ class Layer2Agent(BaseResearchAgent):
         )
         self.specialties = specialties
 
+    @abstractmethod
+    def _build_data_summary(
+        self,
+        data: dict[str, Any],
+        context: Optional[Dict[str, Any]],
+    ) -> str:
+        """Build this agent's view of the shared Layer 2 input for the LLM."""
+
+    @abstractmethod
+    def output_from_picks(self, picks: list[StockPick], response: Any) -> AgentOutput:
+        """Turn validated LLM picks (and the LLMResponse they came from) into an AgentOutput."""
+
 
 class FundManagerAgent(BaseResearchAgent):
     """Fund Manager agent (Layer 3)."""
 
+    __slots__ = ()
+
     def __init__(self, system_prompt: str):
         super().__init__(
             agent_id="fund_manager",
@@ -204,6 +262,8 @@ class FundManagerAgent(BaseResearchAgent):
 class CEOAgent(BaseResearchAgent):
     """CEO agent (Layer 4)."""
 
+    __slots__ = ()
+
     def __init__(self, system_prompt: str):
         super().__init__(
             agent_id="ceo",
@@ -235,6 +295,8 @@ class CEOAgent(BaseResearchAgent):
 class HierarchicalAgent(ABC):
     """Base class for hierarchical flow agents."""
 
+    __slots__ = ("agent_id", "name", "system_prompt")
+
     def __init__(self, agent_id: str, name: str, system_prompt: str):
         self.agent_id = agent_id
         self.name = name
@@ -244,6 +306,8 @@ class HierarchicalAgent(ABC):
 class MainPlannerAgent(HierarchicalAgent):
     """Main Planner in hierarchical flow."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def plan(
         self,
@@ -267,6 +331,8 @@ class MainPlannerAgent(HierarchicalAgent):
 class SubPlannerAgent(HierarchicalAgent):
     """Sub-Planner in hierarchical flow."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def decompose(
         self,
@@ -288,6 +354,8 @@ class SubPlannerAgent(HierarchicalAgent):
 class WorkerAgent(HierarchicalAgent):
     """Worker in hierarchical flow."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def execute(
         self,
@@ -309,6 +377,8 @@ class WorkerAgent(HierarchicalAgent):
 class JudgeAgent(HierarchicalAgent):
     """Judge in hierarchical flow."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def evaluate(
         self,
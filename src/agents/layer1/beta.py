@@ -2,13 +2,15 @@
 
 from typing import Any, Dict, Optional
 
-from src.agents.base import AgentOutput, Layer1Agent, StockPick
+from src.agents.base import AgentOutput, Layer1Agent
 from src.llm.client import AgentLLMClient
 
 
 class BetaAgent(Layer1Agent):
     """Beta agent specializing in AI software and cloud infrastructure."""
 
+    __slots__ = ("llm_client", "coverage_tickers")
+
     # Default coverage universe for software/cloud
     DEFAULT_TICKERS = [
         "MSFT", "GOOGL", "AMZN", "META",  # Hyperscalers
@@ -70,15 +72,14 @@ class BetaAgent(Layer1Agent):
         # Build data summary for the LLM
         data_summary = self._build_data_summary(data, context)
 
-        # Get picks from LLM
-        picks_data, response = await self.llm_client.get_top_picks(
+        # Stream picks from the LLM; each is validated as soon as it arrives
+        stream = self.llm_client.stream_top_picks(
             system_prompt=self.system_prompt,
             data_summary=data_summary,
             num_picks=5,
         )
-
-        # Convert to StockPick objects
-        picks = [StockPick(**pick) for pick in picks_data]
+        picks = [pick async for pick in stream]
+        response = stream.response
 
         return AgentOutput(
             agent_id=self.agent_id,
@@ -1,23 +1,79 @@
 """Gamma Agent - AI Applications Specialist."""
 
-from typing import Any, Dict, Optional
-
-from src.agents.base import AgentOutput, Layer1Agent, StockPick
+import io
+import json
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from typing import AbstractSet, Any, ClassVar, Dict, Iterator, Optional
+
+from src.agents.base import AgentOutput, Layer1Agent
 from src.llm.client import AgentLLMClient
 
 
+def _relevance_key(ticker: str, company_data: Any) -> Optional[tuple]:
+    # Only the fields _is_relevant_sector reads, so edits elsewhere keep cache hits
+    if isinstance(company_data, dict):
+        return (
+            ticker,
+            company_data.get("sector", ""),
+            company_data.get("industry", ""),
+            company_data.get("description", ""),
+        )
+    if isinstance(company_data, str):
+        return (ticker, company_data)
+    return None
+
+
+def _scan_joined(pattern: re.Pattern, blobs: list[str]) -> Iterator[int]:
+    """Yield indices of blobs containing a match, using one joined search text.
+
+    The search resumes at the next blob after each hit, so the Python loop runs
+    once per matching blob rather than once per blob.
+    """
+    if not blobs:
+        return
+    text = "\n".join(blobs)
+    # ends[i] is the offset just past blob i and its separator
+    ends = list(accumulate(len(blob) + 1 for blob in blobs))
+    pos = 0
+    while (match := pattern.search(text, pos)) is not None:
+        idx = bisect_right(ends, match.start())
+        yield idx
+        pos = ends[idx]
+
+
 class GammaAgent(Layer1Agent):
     """Gamma agent specializing in AI applications and vertical software."""
 
+    __slots__ = ("llm_client", "coverage_tickers", "_relevance_cache")
+
     # Default coverage universe for AI applications
-    DEFAULT_TICKERS = [
+    DEFAULT_TICKERS: ClassVar[tuple[str, ...]] = (
         "TSLA", "ISRG", "DXCM", "VEEV",   # Healthcare/Robotics
         "ADBE", "INTU", "ADSK", "WDAY",   # Creative/Enterprise
         "AAPL", "SPOT", "PINS", "SNAP",   # Consumer
         "SYM", "PATH", "AI",              # Industrial/Pure-play AI
         "ABNB", "UBER", "DASH",           # Platform economy
         "ROK", "HON", "ABB",              # Industrial automation
-    ]
+    )
+    # Shared by every instance until its coverage is first edited
+    _DEFAULT_COVERAGE: ClassVar[frozenset[str]] = frozenset(DEFAULT_TICKERS)
+
+    # Substring matches (no word boundaries), same as the original keyword scan
+    _SECTOR_TERMS = (
+        "healthcare", "robotics", "autonomous", "automation",
+        "consumer", "entertainment", "creative", "design",
+        "industrial", "manufacturing", "medical",
+    )
+    _AI_TERMS = ("ai", "artificial intelligence", "machine learning", "neural")
+    # Exact sector/industry names short-circuit the substring scan
+    _SECTOR_NAMES = frozenset(_SECTOR_TERMS)
+    _RELEVANT_SECTOR_RE = re.compile("|".join(_SECTOR_TERMS), re.IGNORECASE)
+    _AI_MENTION_RE = re.compile("|".join(_AI_TERMS), re.IGNORECASE)
+    _RELEVANT_ANY_RE = re.compile("|".join(_SECTOR_TERMS + _AI_TERMS), re.IGNORECASE)
+    _RELEVANCE_CACHE_MAX = 4096
+    _BATCH_SCAN_MIN = 64
 
     def __init__(
         self,
@@ -41,7 +97,8 @@ class GammaAgent(Layer1Agent):
             sectors=sectors,
         )
         self.llm_client = llm_client
-        self.coverage_tickers = self.DEFAULT_TICKERS.copy()
+        self.coverage_tickers: AbstractSet[str] = self._DEFAULT_COVERAGE
+        self._relevance_cache: dict[tuple, bool] = {}
 
     def set_llm_client(self, client: AgentLLMClient) -> None:
         """Set the LLM client.
@@ -71,15 +128,14 @@ class GammaAgent(Layer1Agent):
         # Build data summary for the LLM
         data_summary = self._build_data_summary(data, context)
 
-        # Get picks from LLM
-        picks_data, response = await self.llm_client.get_top_picks(
+        # Stream picks from the LLM; each is validated as soon as it arrives
+        stream = self.llm_client.stream_top_picks(
             system_prompt=self.system_prompt,
             data_summary=data_summary,
             num_picks=5,
         )
-
-        # Convert to StockPick objects
-        picks = [StockPick(**pick) for pick in picks_data]
+        picks = [pick async for pick in stream]
+        response = stream.response
 
         return AgentOutput(
             agent_id=self.agent_id,
@@ -109,55 +165,125 @@ class GammaAgent(Layer1Agent):
         Returns:
             Formatted data summary string
         """
-        lines = [
-            "# AI Applications Analysis",
-            "",
-            "## Coverage Universe",
-            f"Focus: {', '.join(self.sectors)}",
-            "",
-        ]
+        buf = io.StringIO()
+        write = buf.write
+        write("# AI Applications Analysis\n\n## Coverage Universe\n")
+        write(f"Focus: {', '.join(self.sectors)}\n\n")
 
         # Add company data
         companies = data.get("companies", {})
         if companies:
-            lines.append("## Company Data")
+            write("## Company Data\n")
+            included = self._included_tickers(companies)
             for ticker, company_data in companies.items():
-                if ticker in self.coverage_tickers or self._is_relevant_sector(company_data):
-                    lines.append(f"\n### {ticker}")
+                if ticker in included:
+                    write(f"\n### {ticker}\n")
                     if isinstance(company_data, str):
-                        lines.append(company_data)
+                        write(company_data)
                     else:
-                        lines.append(str(company_data))
+                        # Compact JSON keeps the prompt smaller than str(dict)
+                        write(json.dumps(company_data, separators=(",", ":"), default=str))
+                    write("\n")
 
         # Add market context
         market_context = data.get("market_context", "")
         if market_context:
-            lines.extend([
-                "",
-                "## Market Context",
-                market_context,
-            ])
+            write(f"\n## Market Context\n{market_context}\n")
 
         # Add vertical-specific trends
         vertical_trends = data.get("vertical_trends", {})
         if vertical_trends:
-            lines.extend([
-                "",
-                "## Vertical Industry Trends",
-            ])
+            write("\n## Vertical Industry Trends\n")
             for vertical, trend in vertical_trends.items():
-                lines.append(f"\n### {vertical}")
-                lines.append(trend)
+                write(f"\n### {vertical}\n{trend}\n")
 
         # Add previous loop context if available
         if context and context.get("previous_picks"):
-            lines.extend([
-                "",
-                "## Previous Analysis (for reference)",
-                f"Previous picks: {', '.join(p.get('ticker', '') for p in context['previous_picks'])}",
-            ])
+            write("\n## Previous Analysis (for reference)\n")
+            previous = ", ".join(p.get("ticker", "") for p in context["previous_picks"])
+            write(f"Previous picks: {previous}\n")
+
+        return buf.getvalue()
 
-        return "\n".join(lines)
+    def _included_tickers(self, companies: dict[str, Any]) -> set[str]:
+        """Resolve which companies belong in the summary.
+
+        Cache misses are scanned together: one regex pass over the joined
+        fields once there are enough of them, per company otherwise.
+
+        Args:
+            companies: Company data keyed by ticker
+
+        Returns:
+            Tickers that are covered or in a relevant sector
+        """
+        cache = self._relevance_cache
+        included = set()
+        misses = []
+        for ticker, company_data in companies.items():
+            if ticker in self.coverage_tickers:
+                included.add(ticker)
+                continue
+            key = _relevance_key(ticker, company_data)
+            if key is None:
+                continue
+            hit = cache.get(key)
+            if hit is None:
+                misses.append((key, ticker, company_data))
+            elif hit:
+                included.add(ticker)
+
+        if not misses:
+            return included
+
+        miss_data = [company_data for _, _, company_data in misses]
+        if len(misses) >= self._BATCH_SCAN_MIN:
+            hits = self._scan_relevance_batch(miss_data)
+        else:
+            hits = [self._is_relevant_sector(company_data) for company_data in miss_data]
+
+        if len(cache) + len(misses) > self._RELEVANCE_CACHE_MAX:
+            cache.clear()
+        for (key, ticker, _), hit in zip(misses, hits):
+            cache[key] = hit
+            if hit:
+                included.add(ticker)
+        return included
+
+    def _scan_relevance_batch(self, items: list[Any]) -> list[bool]:
+        """Bulk equivalent of _is_relevant_sector over many companies.
+
+        Args:
+            items: Company data dicts or strings
+
+        Returns:
+            Relevance flag per item, in input order
+        """
+        hits = [False] * len(items)
+        text_idx = [i for i, item in enumerate(items) if isinstance(item, str)]
+        dict_idx = [i for i, item in enumerate(items) if isinstance(item, dict)]
+
+        for j in _scan_joined(self._RELEVANT_ANY_RE, [items[i] for i in text_idx]):
+            hits[text_idx[j]] = True
+
+        names = self._SECTOR_NAMES
+        sector_idx = []
+        sector_blobs = []
+        for i in dict_idx:
+            sector = items[i].get("sector", "")
+            industry = items[i].get("industry", "")
+            if sector.lower() in names or industry.lower() in names:
+                hits[i] = True
+            else:
+                sector_idx.append(i)
+                sector_blobs.append(f"{sector}\n{industry}")
+        for j in _scan_joined(self._RELEVANT_SECTOR_RE, sector_blobs):
+            hits[sector_idx[j]] = True
+        descriptions = [items[i].get("description", "") for i in dict_idx]
+        for j in _scan_joined(self._AI_MENTION_RE, descriptions):
+            hits[dict_idx[j]] = True
+
+        return hits
 
     def _is_relevant_sector(self, company_data: Any) -> bool:
         """Check if company is in a relevant sector.
@@ -168,39 +294,28 @@ class GammaAgent(Layer1Agent):
         Returns:
             True if relevant sector
         """
-        relevant_terms = [
-            "healthcare", "robotics", "autonomous", "automation",
-            "consumer", "entertainment", "creative", "design",
-            "industrial", "manufacturing", "medical",
-        ]
-        ai_terms = ["ai", "artificial intelligence", "machine learning", "neural"]
-
         # Handle case where company_data is a string instead of dict
         if isinstance(company_data, str):
-            company_data_lower = company_data.lower()
-            has_sector_match = any(term in company_data_lower for term in relevant_terms)
-            has_ai_mention = any(term in company_data_lower for term in ai_terms)
-            return has_sector_match or has_ai_mention
+            return self._RELEVANT_ANY_RE.search(company_data) is not None
 
         if not isinstance(company_data, dict):
             return False
 
-        sector = company_data.get("sector", "").lower()
-        industry = company_data.get("industry", "").lower()
-        description = company_data.get("description", "").lower()
-
-        has_sector_match = any(term in sector or term in industry for term in relevant_terms)
-        has_ai_mention = any(term in description for term in ai_terms)
-
-        return has_sector_match or has_ai_mention
+        sector = company_data.get("sector", "")
+        industry = company_data.get("industry", "")
+        if sector.lower() in self._SECTOR_NAMES or industry.lower() in self._SECTOR_NAMES:
+            return True
+        if self._RELEVANT_SECTOR_RE.search(f"{sector}\n{industry}"):
+            return True
+        return self._AI_MENTION_RE.search(company_data.get("description", "")) is not None
 
     def get_coverage_universe(self) -> list[str]:
         """Get the list of tickers this agent covers.
 
         Returns:
-            List of ticker symbols
+            Sorted list of ticker symbols
         """
-        return self.coverage_tickers.copy()
+        return sorted(self.coverage_tickers)
 
     def add_to_coverage(self, ticker: str) -> None:
         """Add a ticker to coverage universe.
@@ -208,8 +323,7 @@ class GammaAgent(Layer1Agent):
         Args:
             ticker: Ticker symbol to add
         """
-        if ticker not in self.coverage_tickers:
-            self.coverage_tickers.append(ticker)
+        self._own_coverage().add(ticker)
 
     def remove_from_coverage(self, ticker: str) -> None:
         """Remove a ticker from coverage universe.
@@ -217,5 +331,10 @@ class GammaAgent(Layer1Agent):
         Args:
             ticker: Ticker symbol to remove
         """
-        if ticker in self.coverage_tickers:
-            self.coverage_tickers.remove(ticker)
+        self._own_coverage().discard(ticker)
+
+    def _own_coverage(self) -> set[str]:
+        # Copy-on-write: promote the shared default to a private set on first edit
+        if not isinstance(self.coverage_tickers, set):
+            self.coverage_tickers = set(self.coverage_tickers)
+        return self.coverage_tickers
@@ -1,8 +1,24 @@
 """Hierarchical agents for Cursor-style parallel worker pattern."""
 
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, List, Optional
 import asyncio
+import hashlib
+import json
+import logging
+import re
 import uuid
+from itertools import islice
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 from src.agents.base import (
     HierarchicalArtifact,
@@ -13,12 +29,69 @@ from src.agents.base import (
     SubPlannerAgent,
     WorkerAgent,
 )
+from src.agents.layer1.plan_cache import PlanCache
 from src.llm.client import LLMClient
+from src.llm.tokens import PromptBudget, truncate_tokens
+
+logger = logging.getLogger(__name__)
+
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_SLUG_RE = re.compile(r"\s+")
+_MAX_FALLBACK_COMPONENTS = 10
+# Doc names listed in planner prompts; bounds prompt size for large doc sets
+_MAX_PROMPT_DOC_KEYS = 50
+# Per-doc budget in worker context
+_MAX_DOC_TOKENS = 512
+# Characters of each doc handed to the tokenizer; a token is rarely longer than 16
+_MAX_DOC_CHARS = _MAX_DOC_TOKENS * 16
+# Cap on the whole worker context section (~32k tokens)
+_MAX_CONTEXT_CHARS = 128_000
+# Content keys listed per artifact in the judge prompt
+_MAX_JUDGE_CONTENT_KEYS = 16
+
+
+def _extract_json(content: str) -> str:
+    """Return the body of the first fenced code block, or the whole reply."""
+    match = _JSON_FENCE.search(content)
+    return (match.group(1) if match else content).strip()
+
+
+def _slug(component: str) -> str:
+    """Task-id prefix for a component; whitespace runs collapse to one underscore."""
+    return _SLUG_RE.sub("_", component.strip()).lower()
+
+
+def _doc_keys_preview(docs: dict[str, Any]) -> str:
+    """Comma-separated names of the first _MAX_PROMPT_DOC_KEYS docs."""
+    return ", ".join(islice(docs, _MAX_PROMPT_DOC_KEYS))
+
+
+def _is_component_line(line: str) -> bool:
+    """Whether a stripped reply line names a component (skips blanks and headings)."""
+    return bool(line) and not line.startswith("#")
+
+
+def _parse_line(line: str) -> str:
+    """Strip a leading bullet marker from a stripped reply line."""
+    if line.startswith(("- ", "* ")):
+        return line[2:].strip()
+    return line
 
 
 class MainPlannerAgentImpl(MainPlannerAgent):
     """Main Planner implementation for hierarchical research flow."""
 
+    __slots__ = ("llm_client",)
+
+    # Static part of the request, kept byte-identical so the provider can cache it
+    _INSTRUCTIONS = """\
+Break the research project below into major components. Each component should be:
+1. Independently researchable
+2. Suitable for delegation to a sub-planner
+3. Clear in scope
+
+Return a JSON list of component names (strings)."""
+
     def __init__(
         self,
         agent_id: str,
@@ -60,48 +133,49 @@ class MainPlannerAgentImpl(MainPlannerAgent):
         user_message = f"""Project: {project_description}
 
 Available context/documentation:
-{list(context_docs.keys())}
-{gap_context}
-
-Break this research project into major components. Each component should be:
-1. Independently researchable
-2. Suitable for delegation to a sub-planner
-3. Clear in scope
-
-Return a JSON list of component names (strings)."""
+{_doc_keys_preview(context_docs)}
+{gap_context}"""
 
         response = await self.llm_client.complete(
             system_prompt=self.system_prompt,
             user_message=user_message,
             temperature=0.5,
+            cache_prefix=self._INSTRUCTIONS,
         )
 
         # Parse components from response
-        import json
         try:
-            content = response.content.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-            components = json.loads(content)
+            components = _json_loads(_extract_json(response.content))
             return components if isinstance(components, list) else []
         except json.JSONDecodeError:
-            # Fallback: extract bullet points
-            lines = response.content.strip().split("\n")
-            components = []
-            for line in lines:
-                line = line.strip()
-                if line.startswith("- ") or line.startswith("* "):
-                    components.append(line[2:].strip())
-                elif line and not line.startswith("#"):
-                    components.append(line)
-            return components[:10]  # Limit to 10 components
+            # Fallback: extract bullet points, stopping once the limit is reached
+            lines = map(str.strip, response.content.splitlines())
+            return list(islice(
+                (_parse_line(line) for line in lines if _is_component_line(line)),
+                _MAX_FALLBACK_COMPONENTS,
+            ))
 
 
 class SubPlannerAgentImpl(SubPlannerAgent):
     """Sub-Planner implementation for breaking components into tasks."""
 
+    __slots__ = ("component", "llm_client", "plan_cache")
+
+    _INSTRUCTIONS = """Break the component below into atomic, executable tasks. Each task should:
+1. Be completable by a single worker
+2. Have clear inputs and expected outputs
+3. Be specific and actionable
+
+Return a JSON array of tasks with this structure:
+[
+  {
+    "description": "Task description",
+    "inputs": {"key": "value"},
+    "expected_output": "What the task should produce",
+    "dependencies": []
+  }
+]"""
+
     def __init__(
         self,
         agent_id: str,
@@ -109,10 +183,12 @@ class SubPlannerAgentImpl(SubPlannerAgent):
         system_prompt: str,
         component: str,
         llm_client: Optional[LLMClient] = None,
+        plan_cache: Optional[PlanCache] = None,
     ):
         super().__init__(agent_id, name, system_prompt)
         self.component = component
         self.llm_client = llm_client
+        self.plan_cache = plan_cache
 
     def set_llm_client(self, client: LLMClient) -> None:
         """Set the LLM client."""
@@ -132,56 +208,42 @@ class SubPlannerAgentImpl(SubPlannerAgent):
         Returns:
             List of tasks for workers
         """
+        if self.plan_cache is not None:
+            templates = self.plan_cache.get(component, relevant_docs)
+            if templates is not None:
+                return self._build_tasks(component, templates)
+
         if not self.llm_client:
             raise RuntimeError("LLM client not set")
 
         user_message = f"""Component: {component}
 
 Available data/context:
-{list(relevant_docs.keys())}
-
-Break this component into atomic, executable tasks. Each task should:
-1. Be completable by a single worker
-2. Have clear inputs and expected outputs
-3. Be specific and actionable
-
-Return a JSON array of tasks with this structure:
-[
-  {{
-    "description": "Task description",
-    "inputs": {{"key": "value"}},
-    "expected_output": "What the task should produce",
-    "dependencies": []
-  }}
-]"""
+{_doc_keys_preview(relevant_docs)}"""
 
         response = await self.llm_client.complete(
             system_prompt=self.system_prompt,
             user_message=user_message,
             temperature=0.5,
+            cache_prefix=self._INSTRUCTIONS,
         )
 
         # Parse tasks from response
-        import json
         try:
-            content = response.content.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-            tasks_data = json.loads(content)
-
-            tasks = []
-            for i, task_data in enumerate(tasks_data):
-                task = HierarchicalTask(
-                    task_id=f"{component.lower().replace(' ', '_')}_{i}_{uuid.uuid4().hex[:6]}",
-                    component=component,
-                    description=task_data.get("description", ""),
-                    inputs=task_data.get("inputs", {}),
-                    expected_output=task_data.get("expected_output", ""),
-                    dependencies=task_data.get("dependencies", []),
+            tasks_data = _json_loads(_extract_json(response.content))
+            tasks = self._build_tasks(component, tasks_data)
+
+            if self.plan_cache is not None:
+                self.plan_cache.put(
+                    component,
+                    relevant_docs,
+                    [
+                        task.model_dump(
+                            include={"description", "inputs", "expected_output", "dependencies"}
+                        )
+                        for task in tasks
+                    ],
                 )
-                tasks.append(task)
 
             return tasks
 
@@ -189,7 +251,7 @@ Return a JSON array of tasks with this structure:
             # Fallback: create single task
             return [
                 HierarchicalTask(
-                    task_id=f"{component.lower().replace(' ', '_')}_0",
+                    task_id=f"{_slug(component)}_0",
                     component=component,
                     description=f"Research and analyze {component}",
                     inputs={"component": component},
@@ -198,19 +260,39 @@ Return a JSON array of tasks with this structure:
                 )
             ]
 
+    @staticmethod
+    def _build_tasks(component: str, tasks_data: list[dict[str, Any]]) -> list[HierarchicalTask]:
+        """Turn task templates into tasks with fresh ids."""
+        prefix = _slug(component)
+        return [
+            HierarchicalTask(
+                task_id=f"{prefix}_{i}_{uuid.uuid4().hex[:6]}",
+                component=component,
+                description=task_data.get("description", ""),
+                inputs=task_data.get("inputs", {}),
+                expected_output=task_data.get("expected_output", ""),
+                dependencies=task_data.get("dependencies", []),
+            )
+            for i, task_data in enumerate(tasks_data)
+        ]
+
 
 class WorkerAgentImpl(WorkerAgent):
     """Worker implementation for executing research tasks."""
 
+    __slots__ = ("llm_client", "artifact_cache")
+
     def __init__(
         self,
         agent_id: str,
         name: str,
         system_prompt: str,
         llm_client: Optional[LLMClient] = None,
+        artifact_cache: Optional[dict[str, HierarchicalArtifact]] = None,
     ):
         super().__init__(agent_id, name, system_prompt)
         self.llm_client = llm_client
+        self.artifact_cache = artifact_cache
 
     def set_llm_client(self, client: LLMClient) -> None:
         """Set the LLM client."""
@@ -233,13 +315,66 @@ class WorkerAgentImpl(WorkerAgent):
         if not self.llm_client:
             raise RuntimeError("LLM client not set")
 
+        return await self.execute_request(task, self.build_request(task, relevant_docs))
+
+    async def execute_request(
+        self, task: HierarchicalTask, request: dict[str, Any]
+    ) -> HierarchicalArtifact:
+        """Execute a task whose request was already built.
+
+        Args:
+            task: Task to execute
+            request: Arguments from build_request
+
+        Returns:
+            Artifact produced by task
+        """
+        cached = self.cached_artifact(task, request)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self.llm_client.complete(**request)
+            return self.artifact_from_reply(task, request, response.content)
+
+        except Exception as e:
+            return HierarchicalArtifact(
+                task_id=task.task_id,
+                worker_id=self.agent_id,
+                content={},
+                status="failed",
+                error=str(e),
+            )
+
+    def build_request(
+        self, task: HierarchicalTask, relevant_docs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build the completion arguments for a task.
+
+        Args:
+            task: Task to execute
+            relevant_docs: Relevant documentation/data
+
+        Returns:
+            Keyword arguments for LLMClient.complete
+        """
         # Build context from relevant docs
-        context_summary = ""
+        budget = PromptBudget(_MAX_CONTEXT_CHARS)
         for key, doc in relevant_docs.items():
-            if isinstance(doc, str):
-                context_summary += f"\n## {key}\n{doc[:2000]}"  # Truncate long docs
-            else:
-                context_summary += f"\n## {key}\n{str(doc)[:2000]}"
+            # Strings are sliced without copying the rest; other docs still go
+            # through str() in full, so they should arrive pre-summarized.
+            # Once the budget is full, later docs are skipped entirely
+            text = doc[:_MAX_DOC_CHARS] if isinstance(doc, str) else str(doc)[:_MAX_DOC_CHARS]
+            if not budget.add(f"\n## {key}\n{truncate_tokens(text, _MAX_DOC_TOKENS)}"):
+                break
+        context_summary = budget.text()
+
+        # The docs are the same for every task in a cycle, so they lead the request
+        # and become part of the cached prefix; only the task details vary
+        context_prefix = f"""Complete the task below and provide your analysis/output as JSON.
+
+Relevant Context:
+{context_summary}"""
 
         user_message = f"""Task: {task.description}
 
@@ -247,52 +382,82 @@ Component: {task.component}
 Expected Output: {task.expected_output}
 
 Task Inputs:
-{task.inputs}
+{task.inputs}"""
 
-Relevant Context:
-{context_summary}
+        return {
+            "system_prompt": self.system_prompt,
+            "user_message": user_message,
+            "temperature": 0.7,
+            "cache_prefix": context_prefix,
+        }
 
-Complete this task and provide your analysis/output as JSON."""
+    def cached_artifact(
+        self,
+        task: HierarchicalTask,
+        request: dict[str, Any],
+    ) -> Optional[HierarchicalArtifact]:
+        """Look up a previous successful artifact for an identical request.
 
-        try:
-            response = await self.llm_client.complete(
-                system_prompt=self.system_prompt,
-                user_message=user_message,
-                temperature=0.7,
-            )
+        Args:
+            task: Task being executed
+            request: Arguments from build_request
 
-            # Try to parse as JSON, otherwise wrap in content field
-            import json
-            try:
-                content = response.content.strip()
-                if content.startswith("```"):
-                    content = content.split("```")[1]
-                    if content.startswith("json"):
-                        content = content[4:]
-                result = json.loads(content)
-            except json.JSONDecodeError:
-                result = {"content": response.content, "raw": True}
+        Returns:
+            Cached artifact re-labelled for this task, or None
+        """
+        if self.artifact_cache is None:
+            return None
+        cached = self.artifact_cache.get(self.request_key(request))
+        if cached is None:
+            return None
+        return cached.model_copy(update={"task_id": task.task_id, "worker_id": self.agent_id})
+
+    def artifact_from_reply(
+        self,
+        task: HierarchicalTask,
+        request: dict[str, Any],
+        content: str,
+    ) -> HierarchicalArtifact:
+        """Turn a model reply into a successful artifact and cache it.
 
-            return HierarchicalArtifact(
-                task_id=task.task_id,
-                worker_id=self.agent_id,
-                content=result,
-                status="success",
-            )
+        Args:
+            task: Task that was executed
+            request: Arguments from build_request
+            content: Model reply text
 
-        except Exception as e:
-            return HierarchicalArtifact(
-                task_id=task.task_id,
-                worker_id=self.agent_id,
-                content={},
-                status="failed",
-                error=str(e),
-            )
+        Returns:
+            Artifact for the task
+        """
+        # Try to parse as JSON, otherwise wrap in content field
+        try:
+            result = _json_loads(_extract_json(content))
+        except json.JSONDecodeError:
+            result = {"content": content, "raw": True}
+
+        artifact = HierarchicalArtifact(
+            task_id=task.task_id,
+            worker_id=self.agent_id,
+            content=result,
+            status="success",
+        )
+        if self.artifact_cache is not None:
+            self.artifact_cache[self.request_key(request)] = artifact
+        return artifact
+
+    @staticmethod
+    def request_key(request: dict[str, Any]) -> str:
+        """Fingerprint of a request from build_request."""
+        # The prompt parts fully determine the request, so they double as the cache key
+        return hashlib.sha256(
+            f"{request['system_prompt']}\0{request['cache_prefix']}\0{request['user_message']}".encode()
+        ).hexdigest()
 
 
 class JudgeAgentImpl(JudgeAgent):
     """Judge implementation for evaluating research output."""
 
+    __slots__ = ("quality_criteria", "llm_client")
+
     def __init__(
         self,
         agent_id: str,
@@ -336,28 +501,27 @@ class JudgeAgentImpl(JudgeAgent):
                 artifacts_summary.append({
                     "task_id": artifact.task_id,
                     "worker": artifact.worker_id,
-                    "content_keys": list(artifact.content.keys()) if artifact.content else [],
+                    "content_keys": list(islice(artifact.content, _MAX_JUDGE_CONTENT_KEYS)),
                 })
 
+        # Nothing succeeded: the verdict is fixed, so skip the LLM round-trip
+        if not artifacts_summary:
+            return JudgeEvaluation(
+                complete=False,
+                quality_score=0.0,
+                gaps=[f"Failed task: {t}" for t in failed_tasks] or ["No artifacts were produced"],
+                recommendations=["Retry failed tasks"] if failed_tasks else [],
+            )
+
         criteria_text = "\n".join(
             f"- {name}: {desc}" for name, desc in self.quality_criteria.items()
         )
 
-        user_message = f"""Evaluate the following research output:
-
-## Artifacts Summary
-{artifacts_summary}
-
-## Failed Tasks
-{failed_tasks}
-
-## Requirements
-{requirements}
-
-## Quality Criteria
+        # Criteria and output format stay fixed across cycles; the artifacts vary
+        instructions = f"""Evaluate the research output below against these quality criteria:
 {criteria_text}
 
-Evaluate against the criteria and provide:
+Provide:
 1. Whether the project is complete (boolean)
 2. A quality score (0-1)
 3. List of gaps that need to be addressed
@@ -371,21 +535,24 @@ Return as JSON:
   "recommendations": ["rec1", "rec2"]
 }}"""
 
+        user_message = f"""## Artifacts Summary
+{_json_dumps(artifacts_summary)}
+
+## Failed Tasks
+{_json_dumps(failed_tasks)}
+
+## Requirements
+{requirements}"""
+
         try:
             response = await self.llm_client.complete(
                 system_prompt=self.system_prompt,
                 user_message=user_message,
+                cache_prefix=instructions,
                 temperature=0.3,  # Lower temperature for consistent evaluation
             )
 
-            import json
-            content = response.content.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-
-            result = json.loads(content)
+            result = _json_loads(_extract_json(response.content))
 
             return JudgeEvaluation(
                 complete=result.get("complete", False),
@@ -415,11 +582,64 @@ class HierarchicalOrchestrator:
         llm_client: LLMClient,
         max_workers: int = 10,
         max_cycles: int = 5,
+        plan_cache: Optional[PlanCache] = None,
+        artifact_cache: Optional[dict[str, HierarchicalArtifact]] = None,
+        batch_threshold: Optional[int] = None,
+        batch_timeout_s: float = 600,
     ):
         self.main_planner = main_planner
         self.llm_client = llm_client
         self.max_workers = max_workers
         self.max_cycles = max_cycles
+        # Opt-in: cycles with at least this many uncached tasks go through the batch
+        # API, falling back to live calls after the timeout. A batch can take up to
+        # batch_timeout_s before anything is yielded, so only enable this when the
+        # run's wall-clock budget can absorb that; None keeps every call live
+        self.batch_threshold = batch_threshold
+        self.batch_timeout_s = batch_timeout_s
+        # Shared by every sub-planner so recurring components skip the LLM
+        self.plan_cache = plan_cache if plan_cache is not None else PlanCache()
+        # Successful worker output by prompt fingerprint; gap-retry cycles reuse unchanged tasks
+        self.artifact_cache = artifact_cache if artifact_cache is not None else {}
+
+        # Concurrency primitives live as long as the orchestrator, so every cycle
+        # shares one limit and identical worker prompts in flight are coalesced
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._idle_workers: asyncio.Queue[WorkerAgentImpl] = asyncio.Queue()
+        self._llm_inflight: dict[str, asyncio.Task[HierarchicalArtifact]] = {}
+
+        # Agents hold no per-call state, so build them once and reuse every cycle
+        self._sub_planner = SubPlannerAgentImpl(
+            agent_id="sub_planner",
+            name="Component Planner",
+            system_prompt="You are a research planner. Break components into specific tasks.",
+            component="",  # decompose() receives the component per call
+            llm_client=llm_client,
+            plan_cache=self.plan_cache,
+        )
+        self._worker_pool = [
+            WorkerAgentImpl(
+                agent_id=f"worker_{i}",
+                name="Research Worker",
+                system_prompt="You execute specific research tasks efficiently.",
+                llm_client=llm_client,
+                artifact_cache=self.artifact_cache,
+            )
+            for i in range(max_workers)
+        ]
+        for worker in self._worker_pool:
+            self._idle_workers.put_nowait(worker)
+        self._judge = JudgeAgentImpl(
+            agent_id="judge",
+            name="Quality Judge",
+            system_prompt="You evaluate research quality and completeness.",
+            quality_criteria={
+                "completeness": "All required analysis completed",
+                "consistency": "Results are internally consistent",
+                "actionability": "Recommendations are actionable",
+            },
+            llm_client=llm_client,
+        )
 
     async def run(
         self,
@@ -448,37 +668,17 @@ class HierarchicalOrchestrator:
                 previous_gaps=gaps if gaps else None,
             )
 
-            # 2. Decompose phase
-            all_tasks = []
-            for component in components:
-                sub_planner = SubPlannerAgentImpl(
-                    agent_id=f"sub_planner_{component}",
-                    name="Component Planner",
-                    system_prompt="You are a research planner. Break components into specific tasks.",
-                    component=component,
-                    llm_client=self.llm_client,
-                )
-                tasks = await sub_planner.decompose(component, context_docs)
-                all_tasks.extend(tasks)
+            # 2. Decompose phase (repeated components are planned once)
+            all_tasks = await self._decompose_components(components, context_docs)
 
             # 3. Execute phase (parallel workers)
-            cycle_artifacts = await self._execute_tasks_parallel(all_tasks, context_docs)
+            cycle_artifacts = [
+                artifact async for artifact in self._execute_tasks_parallel(all_tasks, context_docs)
+            ]
             all_artifacts.extend(cycle_artifacts)
 
             # 4. Evaluate phase
-            judge = JudgeAgentImpl(
-                agent_id="judge",
-                name="Quality Judge",
-                system_prompt="You evaluate research quality and completeness.",
-                quality_criteria={
-                    "completeness": "All required analysis completed",
-                    "consistency": "Results are internally consistent",
-                    "actionability": "Recommendations are actionable",
-                },
-                llm_client=self.llm_client,
-            )
-
-            evaluation = await judge.evaluate(cycle_artifacts, requirements)
+            evaluation = await self._judge.evaluate(cycle_artifacts, requirements)
 
             # 5. Check completion
             if evaluation.complete:
@@ -500,51 +700,177 @@ class HierarchicalOrchestrator:
             "remaining_gaps": gaps,
         }
 
+    async def _decompose_components(
+        self,
+        components: list[str],
+        context_docs: dict[str, Any],
+    ) -> list[HierarchicalTask]:
+        """Decompose components concurrently, once per distinct name.
+
+        Args:
+            components: Components from the main planner
+            context_docs: Context documentation
+
+        Returns:
+            Tasks for all components, in component order
+        """
+        async def decompose_with_limit(component: str) -> list[HierarchicalTask]:
+            async with self._semaphore:
+                return await self._sub_planner.decompose(component, context_docs)
+
+        # dict.fromkeys drops repeats but keeps the planner's ordering
+        task_lists = await asyncio.gather(
+            *[decompose_with_limit(component) for component in dict.fromkeys(components)]
+        )
+        return [task for tasks in task_lists for task in tasks]
+
     async def _execute_tasks_parallel(
         self,
         tasks: list[HierarchicalTask],
         context_docs: dict[str, Any],
-    ) -> list[HierarchicalArtifact]:
+    ) -> AsyncIterator[HierarchicalArtifact]:
         """Execute tasks in parallel using worker pool.
 
+        Artifacts are yielded as soon as each task finishes, so callers can
+        start consuming them before the slowest task returns. Large cycles are
+        submitted as one message batch first; anything the batch doesn't
+        answer in time runs through the worker pool.
+
         Args:
             tasks: Tasks to execute
             context_docs: Context documentation
 
-        Returns:
-            List of artifacts from all tasks
+        Yields:
+            Artifacts in completion order; failed tasks yield failed artifacts
         """
-        semaphore = asyncio.Semaphore(self.max_workers)
-
-        async def execute_with_limit(task: HierarchicalTask) -> HierarchicalArtifact:
-            async with semaphore:
-                worker = WorkerAgentImpl(
-                    agent_id=f"worker_{task.task_id}",
-                    name="Research Worker",
-                    system_prompt="You execute specific research tasks efficiently.",
-                    llm_client=self.llm_client,
-                )
-                return await worker.execute(task, context_docs)
+        if self.batch_threshold is not None and len(tasks) >= self.batch_threshold:
+            remaining = []
+            async for artifact in self._execute_tasks_batched(tasks, context_docs, remaining):
+                yield artifact
+            tasks = remaining
 
-        artifacts = await asyncio.gather(
-            *[execute_with_limit(task) for task in tasks],
-            return_exceptions=True,
-        )
+        async for artifact in self._execute_tasks_pooled(tasks, context_docs):
+            yield artifact
 
-        # Convert exceptions to failed artifacts
-        results = []
-        for i, artifact in enumerate(artifacts):
-            if isinstance(artifact, Exception):
-                results.append(
-                    HierarchicalArtifact(
-                        task_id=tasks[i].task_id,
-                        worker_id="error",
-                        content={},
-                        status="failed",
-                        error=str(artifact),
-                    )
-                )
+    async def _execute_tasks_batched(
+        self,
+        tasks: list[HierarchicalTask],
+        context_docs: dict[str, Any],
+        remaining: list[HierarchicalTask],
+    ) -> AsyncIterator[HierarchicalArtifact]:
+        """Execute tasks through a single message batch.
+
+        Args:
+            tasks: Tasks to execute
+            context_docs: Context documentation
+            remaining: Receives tasks the batch did not complete
+
+        Yields:
+            Artifacts for cached and batch-completed tasks
+        """
+        # Workers share one system prompt, so any of them can build the requests
+        worker = self._worker_pool[0]
+        pending = []
+        for task in tasks:
+            request = worker.build_request(task, context_docs)
+            cached = worker.cached_artifact(task, request)
+            if cached is not None:
+                yield cached
             else:
-                results.append(artifact)
+                pending.append((task, request))
+
+        if len(pending) < self.batch_threshold:
+            remaining.extend(task for task, _ in pending)
+            return
+
+        try:
+            responses = await self.llm_client.complete_batch(
+                [request for _, request in pending],
+                timeout_s=self.batch_timeout_s,
+            )
+        except Exception as e:
+            logger.warning(f"Message batch failed, running tasks individually: {e}")
+            responses = None
+
+        if responses is None:
+            remaining.extend(task for task, _ in pending)
+            return
+
+        for (task, request), response in zip(pending, responses):
+            if response is None:
+                remaining.append(task)
+                continue
+            try:
+                artifact = worker.artifact_from_reply(task, request, response.content)
+            except Exception as e:
+                artifact = HierarchicalArtifact(
+                    task_id=task.task_id,
+                    worker_id=worker.agent_id,
+                    content={},
+                    status="failed",
+                    error=str(e),
+                )
+            yield artifact
 
-        return results
+    async def _execute_tasks_pooled(
+        self,
+        tasks: list[HierarchicalTask],
+        context_docs: dict[str, Any],
+    ) -> AsyncIterator[HierarchicalArtifact]:
+        """Execute tasks concurrently on the worker pool.
+
+        Args:
+            tasks: Tasks to execute
+            context_docs: Context documentation
+
+        Yields:
+            Artifacts in completion order; failed tasks yield failed artifacts
+        """
+        # Idle workers wait in the queue; it doubles as the concurrency limit
+        idle_workers = self._idle_workers
+        inflight = self._llm_inflight
+
+        async def execute_with_pooled_worker(
+            task: HierarchicalTask,
+            request: dict[str, Any],
+        ) -> HierarchicalArtifact:
+            worker = await idle_workers.get()
+            try:
+                return await worker.execute_request(task, request)
+            except Exception as e:
+                return HierarchicalArtifact(
+                    task_id=task.task_id,
+                    worker_id="error",
+                    content={},
+                    status="failed",
+                    error=str(e),
+                )
+            finally:
+                idle_workers.put_nowait(worker)
+
+        async def follow(
+            shared: asyncio.Task[HierarchicalArtifact], task: HierarchicalTask
+        ) -> HierarchicalArtifact:
+            # shield: an abandoned follower must not cancel the call others wait on
+            artifact = await asyncio.shield(shared)
+            return artifact.model_copy(update={"task_id": task.task_id})
+
+        def submit(task: HierarchicalTask) -> asyncio.Task[HierarchicalArtifact]:
+            request = self._worker_pool[0].build_request(task, context_docs)
+            key = WorkerAgentImpl.request_key(request)
+            shared = inflight.get(key)
+            if shared is not None:
+                return asyncio.create_task(follow(shared, task))
+            shared = asyncio.create_task(execute_with_pooled_worker(task, request))
+            inflight[key] = shared
+            shared.add_done_callback(lambda _, key=key: inflight.pop(key, None))
+            return shared
+
+        pending = [submit(task) for task in tasks]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                yield await next_done
+        finally:
+            # Consumer stopped early: don't leave workers running unobserved
+            for running in pending:
+                running.cancel()
@@ -0,0 +1,93 @@
+"""Persistent cache of sub-planner task breakdowns."""
+
+import hashlib
+import json
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class PlanCache:
+    """Stores task templates per (component, available docs) so repeat
+    decompositions can skip the LLM call.
+
+    Templates hold only description/inputs/expected_output/dependencies;
+    task ids are generated fresh whenever a template is reused.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite file to persist templates in; in-memory if omitted
+        """
+        if db_path is not None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path) if db_path else ":memory:")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS plan_templates (
+                cache_key TEXT PRIMARY KEY,
+                component TEXT NOT NULL,
+                tasks_json TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(component: str, relevant_docs: dict[str, Any]) -> str:
+        """Build the cache key for a component and its available docs.
+
+        Component names are case- and whitespace-normalized so trivially
+        different spellings from the planner share an entry.
+        """
+        normalized = _WHITESPACE.sub(" ", component).strip().casefold()
+        payload = json.dumps(
+            {"component": normalized, "doc_keys": sorted(relevant_docs.keys())},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, component: str, relevant_docs: dict[str, Any]) -> Optional[list[dict[str, Any]]]:
+        """Look up cached task templates.
+
+        Args:
+            component: Component name
+            relevant_docs: Docs available to the sub-planner
+
+        Returns:
+            List of task templates, or None on a miss
+        """
+        row = self._conn.execute(
+            "SELECT tasks_json FROM plan_templates WHERE cache_key = ?",
+            (self.make_key(component, relevant_docs),),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(
+        self,
+        component: str,
+        relevant_docs: dict[str, Any],
+        templates: list[dict[str, Any]],
+    ) -> None:
+        """Store task templates for a component.
+
+        Args:
+            component: Component name
+            relevant_docs: Docs available to the sub-planner
+            templates: Task templates without ids
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO plan_templates (cache_key, component, tasks_json) "
+            "VALUES (?, ?, ?)",
+            (self.make_key(component, relevant_docs), component, json.dumps(templates)),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -0,0 +1,32 @@
+"""Shared Layer 1 candidate pool for Layer 2 agents."""
+
+from typing import Any
+
+_CACHE_KEY = "_layer1_canonical"
+
+
+def layer1_candidates(data: dict[str, Any]) -> list[str]:
+    """Get the sorted, de-duplicated tickers picked by Layer 1.
+
+    Layer 2 agents receive the same data dict, so the pool is computed once
+    and stored on it. The entry is tied to the layer1_outputs list it was
+    built from and recomputed if that list is replaced.
+
+    Args:
+        data: Layer 2 input data including layer1_outputs
+
+    Returns:
+        Sorted list of candidate tickers
+    """
+    layer1_outputs = data.get("layer1_outputs", [])
+    cached = data.get(_CACHE_KEY)
+    if cached is not None and cached[0] is layer1_outputs:
+        return cached[1]
+
+    tickers = sorted({
+        pick.get("ticker", "")
+        for output in layer1_outputs
+        for pick in output.get("picks", [])
+    })
+    data[_CACHE_KEY] = (layer1_outputs, tickers)
+    return tickers
@@ -3,12 +3,27 @@
 from typing import Any, Dict, Optional
 
 from src.agents.base import AgentOutput, Layer2Agent, StockPick
-from src.llm.client import AgentLLMClient
+from src.agents.layer2.candidates import layer1_candidates
+from src.llm.client import AgentLLMClient, LLMResponse
+
+# (line prefix, financial_data key) pairs rendered per company
+_FUND_METRICS = (
+    ("- P/E: ", "pe_ratio"),
+    ("- Forward P/E: ", "forward_pe"),
+    ("- PEG: ", "peg_ratio"),
+    ("- EV/EBITDA: ", "ev_to_ebitda"),
+    ("- Profit Margin: ", "profit_margin"),
+    ("- ROE: ", "return_on_equity"),
+    ("- Debt/Equity: ", "debt_to_equity"),
+    ("- Revenue Growth: ", "revenue_growth"),
+)
 
 
 class DeltaAgent(Layer2Agent):
     """Delta agent specializing in fundamental analysis."""
 
+    __slots__ = ("llm_client",)
+
     def __init__(
         self,
         name: str,
@@ -60,20 +75,29 @@ class DeltaAgent(Layer2Agent):
         # Build data summary
         data_summary = self._build_data_summary(data, context)
 
-        # Get picks from LLM
-        picks_data, response = await self.llm_client.get_top_picks(
+        # Stream picks from the LLM; each is validated as soon as it arrives
+        stream = self.llm_client.stream_top_picks(
             system_prompt=self.system_prompt,
             data_summary=data_summary,
             num_picks=5,
         )
+        picks = [pick async for pick in stream]
+
+        return self.output_from_picks(picks, stream.response)
 
-        # Convert to StockPick objects and add fundamental scores
-        picks = []
-        for pick in picks_data:
-            stock_pick = StockPick(**pick)
+    def output_from_picks(self, picks: list[StockPick], response: LLMResponse) -> AgentOutput:
+        """Score validated picks and wrap them in this agent's output.
+
+        Args:
+            picks: Picks from the LLM
+            response: LLM response the picks came from
+
+        Returns:
+            AgentOutput with scored picks
+        """
+        for stock_pick in picks:
             # Add fundamental-specific scoring
-            stock_pick.fundamental_score = pick.get("conviction_score", 50)
-            picks.append(stock_pick)
+            stock_pick.fundamental_score = stock_pick.conviction_score
 
         return AgentOutput(
             agent_id=self.agent_id,
@@ -116,18 +140,15 @@ class DeltaAgent(Layer2Agent):
         layer1_outputs = data.get("layer1_outputs", [])
         if layer1_outputs:
             lines.append("## Candidate Pool from Layer 1")
-            all_tickers = set()
             for output in layer1_outputs:
                 agent_name = output.get("agent_name", "Unknown")
                 lines.append(f"\n### {agent_name}'s Picks")
                 for pick in output.get("picks", []):
-                    ticker = pick.get("ticker", "")
-                    all_tickers.add(ticker)
-                    lines.append(f"- {ticker}: {pick.get('thesis', '')[:100]}...")
+                    lines.append(f"- {pick.get('ticker', '')}: {pick.get('thesis', '')[:100]}...")
 
             lines.extend([
                 "",
-                f"## Combined Candidates: {', '.join(sorted(all_tickers))}",
+                f"## Combined Candidates: {', '.join(layer1_candidates(data))}",
                 "",
             ])
 
@@ -143,16 +164,9 @@ class DeltaAgent(Layer2Agent):
                     # Extract key fundamental metrics
                     fd = company_data.get("financial_data", {})
                     if fd:
-                        lines.extend([
-                            f"- P/E: {fd.get('pe_ratio', 'N/A')}",
-                            f"- Forward P/E: {fd.get('forward_pe', 'N/A')}",
-                            f"- PEG: {fd.get('peg_ratio', 'N/A')}",
-                            f"- EV/EBITDA: {fd.get('ev_to_ebitda', 'N/A')}",
-                            f"- Profit Margin: {fd.get('profit_margin', 'N/A')}",
-                            f"- ROE: {fd.get('return_on_equity', 'N/A')}",
-                            f"- Debt/Equity: {fd.get('debt_to_equity', 'N/A')}",
-                            f"- Revenue Growth: {fd.get('revenue_growth', 'N/A')}",
-                        ])
+                        lines.extend(
+                            f"{prefix}{fd.get(key, 'N/A')}" for prefix, key in _FUND_METRICS
+                        )
 
         # Add valuation context
         valuation_context = data.get("valuation_context", "")
@@ -3,12 +3,28 @@
 from typing import Any, Dict, Optional
 
 from src.agents.base import AgentOutput, Layer2Agent, StockPick
-from src.llm.client import AgentLLMClient
+from src.agents.layer2.candidates import layer1_candidates
+from src.llm.client import AgentLLMClient, LLMResponse
+
+# (line prefix, price_data key) pairs rendered per company
+_TECH_METRICS = (
+    ("- Current Price: $", "current_price"),
+    ("- 50-Day SMA: $", "sma_50"),
+    ("- 200-Day SMA: $", "sma_200"),
+    ("- RSI (14): ", "rsi_14"),
+    ("- MACD: ", "macd"),
+    ("- 1D Change: ", "change_1d"),
+    ("- 1M Change: ", "change_1m"),
+    ("- YTD Change: ", "change_ytd"),
+    ("- Relative Volume: ", "relative_volume"),
+)
 
 
 class EpsilonAgent(Layer2Agent):
     """Epsilon agent specializing in technical and momentum analysis."""
 
+    __slots__ = ("llm_client",)
+
     def __init__(
         self,
         name: str,
@@ -60,20 +76,29 @@ class EpsilonAgent(Layer2Agent):
         # Build data summary
         data_summary = self._build_data_summary(data, context)
 
-        # Get picks from LLM
-        picks_data, response = await self.llm_client.get_top_picks(
+        # Stream picks from the LLM; each is validated as soon as it arrives
+        stream = self.llm_client.stream_top_picks(
             system_prompt=self.system_prompt,
             data_summary=data_summary,
             num_picks=5,
         )
+        picks = [pick async for pick in stream]
+
+        return self.output_from_picks(picks, stream.response)
 
-        # Convert to StockPick objects and add technical scores
-        picks = []
-        for pick in picks_data:
-            stock_pick = StockPick(**pick)
+    def output_from_picks(self, picks: list[StockPick], response: LLMResponse) -> AgentOutput:
+        """Score validated picks and wrap them in this agent's output.
+
+        Args:
+            picks: Picks from the LLM
+            response: LLM response the picks came from
+
+        Returns:
+            AgentOutput with scored picks
+        """
+        for stock_pick in picks:
             # Add technical-specific scoring
-            stock_pick.technical_score = pick.get("conviction_score", 50)
-            picks.append(stock_pick)
+            stock_pick.technical_score = stock_pick.conviction_score
 
         return AgentOutput(
             agent_id=self.agent_id,
@@ -116,18 +141,18 @@ class EpsilonAgent(Layer2Agent):
         layer1_outputs = data.get("layer1_outputs", [])
         if layer1_outputs:
             lines.append("## Candidate Pool from Layer 1")
-            all_tickers = set()
             for output in layer1_outputs:
                 agent_name = output.get("agent_name", "Unknown")
                 lines.append(f"\n### {agent_name}'s Picks")
                 for pick in output.get("picks", []):
-                    ticker = pick.get("ticker", "")
-                    all_tickers.add(ticker)
-                    lines.append(f"- {ticker}: Conviction {pick.get('conviction_score', 'N/A')}")
+                    lines.append(
+                        f"- {pick.get('ticker', '')}: "
+                        f"Conviction {pick.get('conviction_score', 'N/A')}"
+                    )
 
             lines.extend([
                 "",
-                f"## Combined Candidates: {', '.join(sorted(all_tickers))}",
+                f"## Combined Candidates: {', '.join(layer1_candidates(data))}",
                 "",
             ])
 
@@ -143,17 +168,9 @@ class EpsilonAgent(Layer2Agent):
                     # Extract key technical metrics
                     pd = company_data.get("price_data", {})
                     if pd:
-                        lines.extend([
-                            f"- Current Price: ${pd.get('current_price', 'N/A')}",
-                            f"- 50-Day SMA: ${pd.get('sma_50', 'N/A')}",
-                            f"- 200-Day SMA: ${pd.get('sma_200', 'N/A')}",
-                            f"- RSI (14): {pd.get('rsi_14', 'N/A')}",
-                            f"- MACD: {pd.get('macd', 'N/A')}",
-                            f"- 1D Change: {pd.get('change_1d', 'N/A')}",
-                            f"- 1M Change: {pd.get('change_1m', 'N/A')}",
-                            f"- YTD Change: {pd.get('change_ytd', 'N/A')}",
-                            f"- Relative Volume: {pd.get('relative_volume', 'N/A')}",
-                        ])
+                        lines.extend(
+                            f"{prefix}{pd.get(key, 'N/A')}" for prefix, key in _TECH_METRICS
+                        )
 
                     # Add price vs moving averages
                     current = pd.get("current_price")
@@ -0,0 +1,131 @@
+"""Concurrent execution of Layer 2 analysts."""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from src.agents.base import AgentOutput, Layer2Agent
+from src.llm.client import AgentLLMClient
+
+logger = logging.getLogger(__name__)
+
+
+async def run_layer2(
+    agents: list[Layer2Agent],
+    data: dict[str, Any],
+    context: Optional[Dict[str, Any]] = None,
+    max_concurrency: Optional[int] = None,
+) -> list[AgentOutput]:
+    """Run Layer 2 agents concurrently, one LLM request each.
+
+    The analysts only share their (read-only) input, so their LLM round-trips
+    overlap. A failing agent yields an empty output rather than cancelling
+    the others.
+
+    Args:
+        agents: Layer 2 agents with LLM clients already set
+        data: Shared Layer 2 input data
+        context: Optional context
+        max_concurrency: Cap on simultaneous requests (provider rate limits);
+            unbounded if None
+
+    Returns:
+        One output per agent, in agent order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def analyze(agent: Layer2Agent) -> AgentOutput:
+        if semaphore is None:
+            return await agent.analyze(data, context)
+        async with semaphore:
+            return await agent.analyze(data, context)
+
+    outputs = await asyncio.gather(
+        *(analyze(agent) for agent in agents),
+        return_exceptions=True,
+    )
+
+    results = []
+    for agent, output in zip(agents, outputs):
+        if isinstance(output, Exception):
+            logger.error(f"Agent {agent.agent_id} failed: {output}")
+            results.append(
+                AgentOutput(
+                    agent_id=agent.agent_id,
+                    agent_name=agent.name,
+                    layer=agent.layer,
+                    picks=[],
+                    reasoning=f"Error: {str(output)}",
+                )
+            )
+        else:
+            results.append(output)
+    return results
+
+
+async def run_layer2_batched(
+    agents: list[Layer2Agent],
+    data: dict[str, Any],
+    context: Optional[Dict[str, Any]],
+    llm_client: AgentLLMClient,
+    max_concurrency: Optional[int] = None,
+) -> list[AgentOutput]:
+    """Run Layer 2 agents through one combined LLM request.
+
+    Each agent still contributes its own persona and data summary; the model
+    answers for all of them at once, saving the extra round-trips. Agents the
+    combined reply doesn't cover, or every agent if it can't be parsed, fall
+    back to run_layer2. The combined request's token usage is reported on the
+    first answered agent's output only, so summing outputs counts it once;
+    every answered output is marked with metadata["combined_request"].
+
+    Args:
+        agents: Layer 2 agents with LLM clients already set
+        data: Shared Layer 2 input data
+        context: Optional context
+        llm_client: Client used for the combined request
+        max_concurrency: Passed to run_layer2 for any fallback requests
+
+    Returns:
+        One output per agent, in agent order
+    """
+    personas = {
+        agent.agent_id: (agent.system_prompt, agent._build_data_summary(data, context))
+        for agent in agents
+    }
+    try:
+        picks_by_agent, response = await llm_client.get_multi_agent_picks(personas)
+    except Exception as e:
+        logger.warning(f"Combined Layer 2 request failed, running agents separately: {e}")
+        return await run_layer2(agents, data, context, max_concurrency)
+
+    # Later agents get the same response with zero usage
+    shared_response = response.model_copy(
+        update={
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+        }
+    )
+    outputs: dict[str, AgentOutput] = {}
+    missing = []
+    for agent in agents:
+        picks = picks_by_agent.get(agent.agent_id)
+        if picks is None:
+            missing.append(agent)
+            continue
+        output = agent.output_from_picks(picks, shared_response if outputs else response)
+        output.metadata["combined_request"] = True
+        outputs[agent.agent_id] = output
+
+    if missing:
+        logger.warning(
+            f"Combined Layer 2 reply missing {[a.agent_id for a in missing]}, "
+            "running them separately"
+        )
+        retried = await run_layer2(missing, data, context, max_concurrency)
+        for agent, output in zip(missing, retried):
+            outputs[agent.agent_id] = output
+
+    return [outputs[agent.agent_id] for agent in agents]
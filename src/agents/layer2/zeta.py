@@ -3,12 +3,28 @@
 from typing import Any, Dict, Optional
 
 from src.agents.base import AgentOutput, Layer2Agent, StockPick
-from src.llm.client import AgentLLMClient
+from src.llm.client import AgentLLMClient, LLMResponse
+
+# (line prefix, financial_data key) pairs rendered per company
+_RISK_METRICS = (
+    ("- Beta: ", "beta"),
+    ("- Debt/Equity: ", "debt_to_equity"),
+    ("- Current Ratio: ", "current_ratio"),
+    ("- 52W High: $", "fifty_two_week_high"),
+    ("- 52W Low: $", "fifty_two_week_low"),
+)
+
+# Top-level data keys the summary reads
+_SUMMARY_INPUTS = (
+    "layer1_outputs", "companies", "short_interest", "analyst_ratings", "macro_risks",
+)
 
 
 class ZetaAgent(Layer2Agent):
     """Zeta agent specializing in risk assessment and contrarian views."""
 
+    __slots__ = ("llm_client", "_summary_cache")
+
     def __init__(
         self,
         name: str,
@@ -31,6 +47,8 @@ class ZetaAgent(Layer2Agent):
             specialties=specialties,
         )
         self.llm_client = llm_client
+        # (summary inputs, summary) from the last build; see _data_summary
+        self._summary_cache: Optional[tuple[tuple[Any, ...], str]] = None
 
     def set_llm_client(self, client: AgentLLMClient) -> None:
         """Set the LLM client.
@@ -58,24 +76,31 @@ class ZetaAgent(Layer2Agent):
             raise RuntimeError("LLM client not set. Call set_llm_client first.")
 
         # Build data summary
-        data_summary = self._build_data_summary(data, context)
+        data_summary = self._data_summary(data, context)
 
-        # Get picks from LLM
-        picks_data, response = await self.llm_client.get_top_picks(
+        # Stream picks from the LLM; each is validated as soon as it arrives
+        stream = self.llm_client.stream_top_picks(
             system_prompt=self.system_prompt,
             data_summary=data_summary,
             num_picks=5,
         )
+        picks = [pick async for pick in stream]
+
+        return self.output_from_picks(picks, stream.response)
+
+    def output_from_picks(self, picks: list[StockPick], response: LLMResponse) -> AgentOutput:
+        """Score validated picks and wrap them in this agent's output.
+
+        Args:
+            picks: Picks from the LLM
+            response: LLM response the picks came from
 
-        # Convert to StockPick objects and add risk scores
-        picks = []
-        for pick in picks_data:
-            stock_pick = StockPick(**pick)
-            # Add risk-specific scoring and position sizing
-            stock_pick.risk_score = pick.get("conviction_score", 50)
-            stock_pick.position_size_recommendation = pick.get("position_size_recommendation", 2.0)
-            stock_pick.bear_case = pick.get("bear_case", "")
-            picks.append(stock_pick)
+        Returns:
+            AgentOutput with scored picks
+        """
+        # Position sizing and bear case come straight from the LLM's picks
+        for stock_pick in picks:
+            stock_pick.risk_score = stock_pick.conviction_score
 
         return AgentOutput(
             agent_id=self.agent_id,
@@ -91,6 +116,32 @@ class ZetaAgent(Layer2Agent):
             },
         )
 
+    def _data_summary(
+        self,
+        data: dict[str, Any],
+        context: Optional[Dict[str, Any]],
+    ) -> str:
+        """Build the data summary, reusing the last one when its inputs are the same objects.
+
+        Retries of analyze() pass the same data, so they skip the rebuild. Inputs
+        are compared by identity, so data edited in place between calls must be
+        passed as new objects.
+
+        Args:
+            data: Raw market data including Layer 1 outputs
+            context: Optional context
+
+        Returns:
+            Formatted data summary string
+        """
+        inputs = (self.specialties, *(data.get(key) for key in _SUMMARY_INPUTS))
+        cached = self._summary_cache
+        if cached is not None and all(a is b for a, b in zip(cached[0], inputs)):
+            return cached[1]
+        summary = self._build_data_summary(data, context)
+        self._summary_cache = (inputs, summary)
+        return summary
+
     def _build_data_summary(
         self,
         data: dict[str, Any],
@@ -119,24 +170,26 @@ class ZetaAgent(Layer2Agent):
         layer1_outputs = data.get("layer1_outputs", [])
         if layer1_outputs:
             lines.append("## Candidate Pool from Layer 1 (Assess Crowding Risk)")
-            all_tickers = {}
+            # ticker -> [(agent name, conviction), ...], with conviction totals
+            # accumulated in the same pass so averaging needs no second walk
+            all_tickers: dict[str, list[tuple[str, Any]]] = {}
+            conviction_totals: dict[str, float] = {}
             for output in layer1_outputs:
+                agent_name = output.get("agent_name", "Unknown")
                 for pick in output.get("picks", []):
                     ticker = pick.get("ticker", "")
-                    if ticker not in all_tickers:
-                        all_tickers[ticker] = []
-                    all_tickers[ticker].append({
-                        "agent": output.get("agent_name", "Unknown"),
-                        "conviction": pick.get("conviction_score", 0),
-                    })
+                    conviction = pick.get("conviction_score", 0)
+                    all_tickers.setdefault(ticker, []).append((agent_name, conviction))
+                    conviction_totals[ticker] = conviction_totals.get(ticker, 0) + conviction
 
             # Show tickers appearing in multiple lists (potential crowding)
             lines.append("\n### Crowding Analysis")
-            for ticker, mentions in sorted(all_tickers.items(), key=lambda x: -len(x[1])):
-                avg_conviction = sum(m["conviction"] for m in mentions) / len(mentions)
+            # reverse=True keeps first-seen order among equally crowded tickers
+            crowded = sorted(all_tickers.items(), key=lambda x: len(x[1]), reverse=True)
+            for ticker, mentions in crowded:
+                avg_conviction = conviction_totals[ticker] / len(mentions)
                 lines.append(f"- {ticker}: {len(mentions)} analyst(s), avg conviction {avg_conviction:.0f}")
-                for mention in mentions:
-                    lines.append(f"  - {mention['agent']}: {mention['conviction']}")
+                lines.extend(f"  - {agent}: {conviction}" for agent, conviction in mentions)
 
         # Add company risk data
         companies = data.get("companies", {})
@@ -151,13 +204,9 @@ class ZetaAgent(Layer2Agent):
                     pd = company_data.get("price_data", {})
 
                     if fd or pd:
-                        lines.extend([
-                            f"- Beta: {fd.get('beta', 'N/A')}",
-                            f"- Debt/Equity: {fd.get('debt_to_equity', 'N/A')}",
-                            f"- Current Ratio: {fd.get('current_ratio', 'N/A')}",
-                            f"- 52W High: ${fd.get('fifty_two_week_high', 'N/A')}",
-                            f"- 52W Low: ${fd.get('fifty_two_week_low', 'N/A')}",
-                        ])
+                        lines.extend(
+                            f"{prefix}{fd.get(key, 'N/A')}" for prefix, key in _RISK_METRICS
+                        )
 
                         # Calculate distance from 52W high/low
                         current = pd.get("current_price")
@@ -177,15 +226,13 @@ class ZetaAgent(Layer2Agent):
         short_interest = data.get("short_interest", {})
         if short_interest:
             lines.append("\n## Short Interest")
-            for ticker, si in short_interest.items():
-                lines.append(f"- {ticker}: {si}")
+            lines.extend(f"- {ticker}: {si}" for ticker, si in short_interest.items())
 
         # Add analyst sentiment (for contrarian view)
         analyst_ratings = data.get("analyst_ratings", {})
         if analyst_ratings:
             lines.append("\n## Analyst Consensus (Contrarian Signal)")
-            for ticker, rating in analyst_ratings.items():
-                lines.append(f"- {ticker}: {rating}")
+            lines.extend(f"- {ticker}: {rating}" for ticker, rating in analyst_ratings.items())
 
         # Add macro risks
         macro_risks = data.get("macro_risks", [])
@@ -194,7 +241,6 @@ class ZetaAgent(Layer2Agent):
                 "",
                 "## Macro Risk Factors",
             ])
-            for risk in macro_risks:
-                lines.append(f"- {risk}")
+            lines.extend(f"- {risk}" for risk in macro_risks)
 
         return "\n".join(lines)
@@ -1,14 +1,32 @@
 """Fund Manager Agent - Portfolio Construction Specialist."""
 
+import re
+from operator import attrgetter
 from typing import Any, Dict, Optional
 
 from src.agents.base import AgentOutput, FundManagerAgent, StockPick
 from src.llm.client import AgentLLMClient
 
+# Thesis keyword -> diversification theme; earlier themes win when several match
+_THEME_KEYWORDS = {
+    "hardware": "hardware",
+    "chip": "hardware",
+    "software": "software",
+    "cloud": "software",
+    "application": "applications",
+    "consumer": "applications",
+}
+_THEME_PRIORITY = ("hardware", "software", "applications")
+# ASCII-only case folding, matching the keywords the way str.lower() substring checks do
+_THEME_RE = re.compile("|".join(_THEME_KEYWORDS), re.IGNORECASE | re.ASCII)
+_conviction = attrgetter("conviction_score")
+
 
 class FundManagerAgentImpl(FundManagerAgent):
     """Fund Manager implementation for synthesizing Layer 2 outputs."""
 
+    __slots__ = ("llm_client",)
+
     def __init__(
         self,
         system_prompt: str,
@@ -51,36 +69,33 @@ class FundManagerAgentImpl(FundManagerAgent):
         # Get Layer 2 outputs
         layer2_outputs = data.get("layer2_outputs", [])
 
-        # Convert to format expected by LLM client
+        # Convert to format expected by LLM client; picks are normalized to dicts
+        # here once, so the reasoning summary can read them without type checks
         layer2_data = [
             {
                 "agent_id": output.get("agent_id"),
                 "agent_name": output.get("agent_name"),
-                "picks": [pick if isinstance(pick, dict) else pick.model_dump()
+                "picks": [pick if isinstance(pick, dict) else pick.cached_dump()
                          for pick in output.get("picks", [])],
                 "reasoning": output.get("reasoning", ""),
             }
             for output in layer2_outputs
         ]
 
-        # Get synthesis from LLM
-        picks_data, response = await self.llm_client.synthesize_picks(
+        # Stream the synthesis from the LLM; each pick is validated as soon as it arrives
+        stream = self.llm_client.stream_synthesized_picks(
             system_prompt=self.system_prompt,
             layer2_outputs=layer2_data,
         )
-
-        # Convert to StockPick objects
-        picks = []
-        for i, pick in enumerate(picks_data[:3]):  # Ensure only top 3
-            stock_pick = StockPick(**pick)
-            picks.append(stock_pick)
+        picks = [pick async for pick in stream][:3]  # Ensure only top 3
+        response = stream.response
 
         return AgentOutput(
             agent_id=self.agent_id,
             agent_name=self.name,
             layer=self.layer,
             picks=picks,
-            reasoning=self._build_synthesis_reasoning(layer2_outputs, picks),
+            reasoning=self._build_synthesis_reasoning(layer2_outputs, layer2_data, picks),
             metadata={
                 "input_tokens": response.input_tokens,
                 "output_tokens": response.output_tokens,
@@ -92,12 +107,14 @@ class FundManagerAgentImpl(FundManagerAgent):
     def _build_synthesis_reasoning(
         self,
         layer2_outputs: list[dict[str, Any]],
+        layer2_data: list[dict[str, Any]],
         final_picks: list[StockPick],
     ) -> str:
         """Build synthesis reasoning summary.
 
         Args:
             layer2_outputs: Original Layer 2 outputs
+            layer2_data: The same outputs with picks as dicts, as sent to the LLM
             final_picks: Final selected picks
 
         Returns:
@@ -109,19 +126,17 @@ class FundManagerAgentImpl(FundManagerAgent):
             "### Input Summary",
         ]
 
-        for output in layer2_outputs:
-            agent = output.get("agent_name", "Unknown")
-            picks = output.get("picks", [])
-            tickers = [p.get("ticker", "") if isinstance(p, dict) else p.ticker for p in picks]
-            lines.append(f"- {agent}: {', '.join(tickers)}")
-
-        lines.extend([
-            "",
-            "### Final Top 3",
-        ])
-
-        for i, pick in enumerate(final_picks, 1):
-            lines.append(f"{i}. {pick.ticker} (Conviction: {pick.conviction_score})")
+        lines.extend(
+            f"- {output.get('agent_name', 'Unknown')}: "
+            + ", ".join(p.get("ticker", "") for p in converted["picks"])
+            for output, converted in zip(layer2_outputs, layer2_data)
+        )
+        lines.append("")
+        lines.append("### Final Top 3")
+        lines.extend(
+            f"{i}. {pick.ticker} (Conviction: {pick.conviction_score})"
+            for i, pick in enumerate(final_picks, 1)
+        )
 
         return "\n".join(lines)
 
@@ -143,24 +158,23 @@ class FundManagerAgentImpl(FundManagerAgent):
             return {}
 
         # Simple conviction-weighted allocation
-        total_conviction = sum(p.conviction_score for p in picks)
+        total_conviction = sum(map(_conviction, picks))
 
         if total_conviction == 0:
             # Equal weight if no conviction scores
             weight = 1.0 / len(picks)
             return {p.ticker: weight for p in picks}
 
-        weights = {}
-        for pick in picks:
-            raw_weight = pick.conviction_score / total_conviction
+        weights = {pick.ticker: pick.conviction_score / total_conviction for pick in picks}
 
-            # Apply constraints if provided
-            if constraints:
-                max_position = constraints.get("max_position", 0.5)
-                min_position = constraints.get("min_position", 0.05)
-                raw_weight = max(min_position, min(max_position, raw_weight))
-
-            weights[pick.ticker] = raw_weight
+        # Apply constraints if provided
+        if constraints:
+            max_position = constraints.get("max_position", 0.5)
+            min_position = constraints.get("min_position", 0.05)
+            weights = {
+                ticker: max(min_position, min(max_position, w))
+                for ticker, w in weights.items()
+            }
 
         # Normalize to sum to 1
         total = sum(weights.values())
@@ -182,16 +196,10 @@ class FundManagerAgentImpl(FundManagerAgent):
         # In real implementation, would use correlation matrix
         unique_themes = set()
         for pick in picks:
-            # Extract theme from thesis keywords
-            thesis_lower = pick.thesis.lower()
-            if "hardware" in thesis_lower or "chip" in thesis_lower:
-                unique_themes.add("hardware")
-            elif "software" in thesis_lower or "cloud" in thesis_lower:
-                unique_themes.add("software")
-            elif "application" in thesis_lower or "consumer" in thesis_lower:
-                unique_themes.add("applications")
-            else:
-                unique_themes.add("other")
+            # Extract theme from thesis keywords: one case-insensitive scan,
+            # then the highest-priority theme among the keywords found
+            found = {_THEME_KEYWORDS[word.lower()] for word in _THEME_RE.findall(pick.thesis)}
+            unique_themes.add(next((theme for theme in _THEME_PRIORITY if theme in found), "other"))
 
         # Score based on unique themes vs picks
         return min(1.0, len(unique_themes) / len(picks))
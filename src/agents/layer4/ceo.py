@@ -1,6 +1,7 @@
 """CEO Agent - Strategic Oversight & Stability."""
 
-from typing import Any, Dict, List, Optional
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, TypeVar
 
 from src.agents.base import (
     AgentOutput,
@@ -11,10 +12,33 @@ from src.agents.base import (
 )
 from src.llm.client import AgentLLMClient
 
+T = TypeVar("T")
+
+
+class _ReadOnlyView(Sequence[T]):
+    """Live, read-only view of a sequence that keeps growing."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Sequence[T]):
+        self._items = items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
 
 class CEOAgentImpl(CEOAgent):
     """CEO implementation for KEEP/SWAP decisions and stability oversight."""
 
+    __slots__ = ("llm_client", "_decision_history", "_history_tickers", "_stability_trend")
+
+    # Reviews kept in full; older ones are dropped, so this also caps the
+    # convergence thresholds. The stability trend keeps every loop's score
+    _HISTORY_LIMIT = 16
+
     def __init__(
         self,
         system_prompt: str,
@@ -28,7 +52,13 @@ class CEOAgentImpl(CEOAgent):
         """
         super().__init__(system_prompt=system_prompt)
         self.llm_client = llm_client
-        self._decision_history: list[CEOOutput] = []
+        # A tuple, rebuilt once per loop, so the getter can hand it out without copying
+        self._decision_history: tuple[CEOOutput, ...] = ()
+        # Appended in place; a memoryview would block resizing, hence _ReadOnlyView
+        self._stability_trend = array("d")
+        # Per history entry: (final tickers in order, same tickers sorted),
+        # derived once so convergence checks only slice
+        self._history_tickers: list[tuple[tuple[str, ...], tuple[str, ...]]] = []
 
     def set_llm_client(self, client: AgentLLMClient) -> None:
         """Set the LLM client.
@@ -86,12 +116,12 @@ class CEOAgentImpl(CEOAgent):
                 stability_score=0.0,  # First loop has no stability
                 loop_number=loop_number,
             )
-            self._decision_history.append(output)
+            self._record(output)
             return output
 
         # Subsequent loops: make KEEP/SWAP decisions
-        previous_data = [p.model_dump() for p in previous_top3]
-        proposed_data = [p.model_dump() for p in proposed_top3]
+        previous_data = [p.cached_dump() for p in previous_top3]
+        proposed_data = [p.cached_dump() for p in proposed_top3]
 
         decisions_data, response = await self.llm_client.get_ceo_decisions(
             system_prompt=self.system_prompt,
@@ -140,10 +170,18 @@ class CEOAgentImpl(CEOAgent):
             stability_score=stability_score,
             loop_number=loop_number,
         )
-        self._decision_history.append(output)
+        self._record(output)
 
         return output
 
+    def _record(self, output: CEOOutput) -> None:
+        """Append a review to the history along with its derived ticker tuples."""
+        ordered = tuple(p.ticker for p in output.final_top3)
+        self._decision_history = self._decision_history[1 - self._HISTORY_LIMIT:] + (output,)
+        self._stability_trend.append(output.stability_score)
+        self._history_tickers.append((ordered, tuple(sorted(ordered))))
+        del self._history_tickers[:-self._HISTORY_LIMIT]
+
     def _calculate_stability(self, decisions: list[CEODecision]) -> float:
         """Calculate stability score based on decisions.
 
@@ -156,24 +194,26 @@ class CEOAgentImpl(CEOAgent):
         if not decisions:
             return 0.0
 
-        keep_count = sum(1 for d in decisions if d.decision == "KEEP")
+        keep_count = [d.decision for d in decisions].count("KEEP")
         return keep_count / len(decisions)
 
-    def get_decision_history(self) -> list[CEOOutput]:
-        """Get history of all CEO decisions.
+    def get_decision_history(self) -> Sequence[CEOOutput]:
+        """Get history of recent CEO decisions.
+
+        Only the last _HISTORY_LIMIT reviews are kept; older ones are dropped.
 
         Returns:
-            List of all CEO outputs
+            Immutable sequence of the retained CEO outputs, oldest first
         """
-        return self._decision_history.copy()
+        return self._decision_history
 
-    def get_stability_trend(self) -> list[float]:
+    def get_stability_trend(self) -> Sequence[float]:
         """Get trend of stability scores across loops.
 
         Returns:
-            List of stability scores by loop
+            Live read-only view of the stability score of every loop
         """
-        return [output.stability_score for output in self._decision_history]
+        return _ReadOnlyView(self._stability_trend)
 
     def check_convergence(
         self,
@@ -182,27 +222,33 @@ class CEOAgentImpl(CEOAgent):
     ) -> dict[str, Any]:
         """Check if picks have converged.
 
+        Only the last _HISTORY_LIMIT reviews are kept, so neither threshold
+        may exceed it.
+
         Args:
             perfect_match_threshold: Loops needed for perfect match
             set_stability_threshold: Loops needed for set stability
 
         Returns:
             Dict with convergence status and reason
+
+        Raises:
+            ValueError: If a threshold exceeds _HISTORY_LIMIT
         """
+        if max(perfect_match_threshold, set_stability_threshold) > self._HISTORY_LIMIT:
+            raise ValueError(
+                f"Convergence thresholds can't exceed the {self._HISTORY_LIMIT} reviews kept"
+            )
         if len(self._decision_history) < 2:
             return {"converged": False, "reason": "Not enough loops"}
 
         # Get recent Top 3 sets
-        recent_sets = []
-        for output in self._decision_history[-set_stability_threshold:]:
-            tickers = tuple(sorted(p.ticker for p in output.final_top3))
-            recent_sets.append(tickers)
+        recent_sets = [tickers for _, tickers in self._history_tickers[-set_stability_threshold:]]
 
         # Check perfect match (same tickers, same order)
-        recent_ordered = []
-        for output in self._decision_history[-perfect_match_threshold:]:
-            ordered = tuple(p.ticker for p in output.final_top3)
-            recent_ordered.append(ordered)
+        recent_ordered = [
+            ordered for ordered, _ in self._history_tickers[-perfect_match_threshold:]
+        ]
 
         if len(recent_ordered) >= perfect_match_threshold:
             if len(set(recent_ordered)) == 1:
@@ -243,4 +289,6 @@ class CEOAgentImpl(CEOAgent):
 
     def reset(self) -> None:
         """Reset decision history for new research run."""
-        self._decision_history.clear()
+        self._decision_history = ()
+        del self._stability_trend[:]
+        self._history_tickers.clear()
@@ -1,12 +1,20 @@
 """Agent factory and registry."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from src.agents.base import (
     AgentLayer,
+    AgentOutput,
     BaseResearchAgent,
     CEOAgent,
     FundManagerAgent,
@@ -20,6 +28,24 @@ from src.agents.base import (
 )
 
 
+@lru_cache(maxsize=None)
+def _agent_factories(layer: str) -> dict[str, type]:
+    """Agent classes by prompt key, imported on first use of each layer."""
+    if layer == "layer1":
+        from src.agents.layer1.alpha import AlphaAgent
+        from src.agents.layer1.beta import BetaAgent
+        from src.agents.layer1.gamma import GammaAgent
+
+        return {"alpha": AlphaAgent, "beta": BetaAgent, "gamma": GammaAgent}
+    if layer == "layer2":
+        from src.agents.layer2.delta import DeltaAgent
+        from src.agents.layer2.epsilon import EpsilonAgent
+        from src.agents.layer2.zeta import ZetaAgent
+
+        return {"delta": DeltaAgent, "epsilon": EpsilonAgent, "zeta": ZetaAgent}
+    raise ValueError(f"No agent factories for {layer}")
+
+
 class AgentRegistry:
     """Registry and factory for research agents."""
 
@@ -33,100 +59,93 @@ class AgentRegistry:
         self._prompts: dict[str, Any] = {}
         self._agents: dict[str, BaseResearchAgent] = {}
         self._hierarchical_agents: dict[str, HierarchicalAgent] = {}
+        # (mtime_ns, size) of the prompts file when it was last parsed
+        self._prompts_stamp: Optional[tuple[int, int]] = None
         self._load_prompts()
 
-    def _load_prompts(self) -> None:
-        """Load agent prompts from YAML."""
+    def _load_prompts(self) -> bool:
+        """Load agent prompts from YAML if the file changed since the last load.
+
+        Returns:
+            True if the file was (re)parsed
+        """
+        stat = os.stat(self.prompts_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._prompts_stamp:
+            return False
         with open(self.prompts_path) as f:
-            self._prompts = yaml.safe_load(f)
+            self._prompts = yaml.load(f, Loader=_YamlLoader)
+        self._prompts_stamp = stamp
+        return True
 
     def reload_prompts(self) -> None:
-        """Reload prompts from file."""
-        self._load_prompts()
-        self._agents.clear()
-        self._hierarchical_agents.clear()
+        """Reload prompts from file; a no-op if the file is unchanged."""
+        if self._load_prompts():
+            self._agents.clear()
+            self._hierarchical_agents.clear()
 
     def get_layer1_agents(self) -> list[Layer1Agent]:
-        """Get all Layer 1 agents."""
-        from src.agents.layer1.alpha import AlphaAgent
-        from src.agents.layer1.beta import BetaAgent
-        from src.agents.layer1.gamma import GammaAgent
-
-        agents = []
-        layer1_prompts = self._prompts.get("layer1", {})
+        """Get all Layer 1 agents.
 
-        if "alpha" in layer1_prompts:
-            config = layer1_prompts["alpha"]
-            agents.append(
-                AlphaAgent(
-                    name=config["name"],
-                    system_prompt=config["system_prompt"],
-                    sectors=config.get("sectors", []),
-                )
-            )
+        Agents are built once per prompts load and reused on later calls.
+        """
+        return self._get_layer_agents("layer1", "sectors")
 
-        if "beta" in layer1_prompts:
-            config = layer1_prompts["beta"]
-            agents.append(
-                BetaAgent(
-                    name=config["name"],
-                    system_prompt=config["system_prompt"],
-                    sectors=config.get("sectors", []),
-                )
-            )
+    def get_layer2_agents(self) -> list[Layer2Agent]:
+        """Get all Layer 2 agents.
 
-        if "gamma" in layer1_prompts:
-            config = layer1_prompts["gamma"]
-            agents.append(
-                GammaAgent(
-                    name=config["name"],
-                    system_prompt=config["system_prompt"],
-                    sectors=config.get("sectors", []),
-                )
-            )
+        Agents are built once per prompts load and reused on later calls.
+        """
+        return self._get_layer_agents("layer2", "specialties")
 
-        return agents
+    def _get_layer_agents(self, layer: str, scope_field: str) -> list[Any]:
+        """Build or fetch the configured agents of a layer, in factory order.
 
-    def get_layer2_agents(self) -> list[Layer2Agent]:
-        """Get all Layer 2 agents."""
-        from src.agents.layer2.delta import DeltaAgent
-        from src.agents.layer2.epsilon import EpsilonAgent
-        from src.agents.layer2.zeta import ZetaAgent
+        Args:
+            layer: Prompts section and factory table name
+            scope_field: Config list passed through as the agent's scope kwarg
 
+        Returns:
+            Agents for every factory that has a prompt config
+        """
+        layer_prompts = self._prompts.get(layer, {})
         agents = []
-        layer2_prompts = self._prompts.get("layer2", {})
-
-        if "delta" in layer2_prompts:
-            config = layer2_prompts["delta"]
-            agents.append(
-                DeltaAgent(
+        for key, factory in _agent_factories(layer).items():
+            if key not in layer_prompts:
+                continue
+            agent = self._agents.get(key)
+            if agent is None:
+                config = layer_prompts[key]
+                agent = factory(
                     name=config["name"],
                     system_prompt=config["system_prompt"],
-                    specialties=config.get("specialties", []),
+                    **{scope_field: config.get(scope_field, [])},
                 )
-            )
+                self._agents[key] = agent
+            agents.append(agent)
+        return agents
 
-        if "epsilon" in layer2_prompts:
-            config = layer2_prompts["epsilon"]
-            agents.append(
-                EpsilonAgent(
-                    name=config["name"],
-                    system_prompt=config["system_prompt"],
-                    specialties=config.get("specialties", []),
-                )
-            )
+    async def run_layer2(
+        self,
+        agents: list[Layer2Agent],
+        data: dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> list[AgentOutput]:
+        """Run Layer 2 agents concurrently.
 
-        if "zeta" in layer2_prompts:
-            config = layer2_prompts["zeta"]
-            agents.append(
-                ZetaAgent(
-                    name=config["name"],
-                    system_prompt=config["system_prompt"],
-                    specialties=config.get("specialties", []),
-                )
-            )
+        Args:
+            agents: Agents from get_layer2_agents with LLM clients set
+            data: Shared Layer 2 input data
+            context: Optional context
+            max_concurrency: Cap on simultaneous LLM requests
 
-        return agents
+        Returns:
+            One output per agent, in agent order
+        """
+        from src.agents.layer2.runner import run_layer2
+
+        return await run_layer2(agents, data, context, max_concurrency)
 
     def get_fund_manager(self) -> FundManagerAgent:
         """Get the Fund Manager agent."""
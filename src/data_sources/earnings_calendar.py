@@ -26,21 +26,29 @@ class EarningsCalendarDataSource(BaseDataSource):
         """Initialize earnings calendar data source."""
         super().__init__(DataSourceType.FUNDAMENTAL)
         self._client: Optional[httpx.AsyncClient] = None
+        self._owns_transport = True
 
-    async def initialize(self) -> None:
-        """Initialize the HTTP client."""
+    async def initialize(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """Initialize the HTTP client.
+
+        Args:
+            transport: Optional shared connection pool; left open on close
+        """
+        self._owns_transport = transport is None
         self._client = httpx.AsyncClient(
             timeout=30.0,
             headers={
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            }
+            },
+            transport=transport,
         )
         self._initialized = True
 
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
-            await self._client.aclose()
+            if self._owns_transport:
+                await self._client.aclose()
             self._client = None
 
     async def fetch(
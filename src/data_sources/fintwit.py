@@ -106,16 +106,23 @@ class FinTwitDataSource(BaseDataSource):
         """Initialize FinTwit data source."""
         super().__init__(DataSourceType.SOCIAL)
         self._client: Optional[httpx.AsyncClient] = None
+        self._owns_transport = True
         self._working_instance: Optional[str] = None
 
-    async def initialize(self) -> None:
-        """Initialize the HTTP client and find working Nitter instance."""
+    async def initialize(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """Initialize the HTTP client and find working Nitter instance.
+
+        Args:
+            transport: Optional shared connection pool; left open on close
+        """
+        self._owns_transport = transport is None
         self._client = httpx.AsyncClient(
             timeout=15.0,
             headers={
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             },
             follow_redirects=True,
+            transport=transport,
         )
         self._initialized = True
 
@@ -156,7 +163,8 @@ class FinTwitDataSource(BaseDataSource):
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
-            await self._client.aclose()
+            if self._owns_transport:
+                await self._client.aclose()
             self._client = None
 
     async def fetch(
@@ -83,10 +83,16 @@ class GitHubTrackerDataSource(BaseDataSource):
         """
         super().__init__(DataSourceType.ALTERNATIVE)
         self._client: Optional[httpx.AsyncClient] = None
+        self._owns_transport = True
         self._token = token
 
-    async def initialize(self) -> None:
-        """Initialize the HTTP client."""
+    async def initialize(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """Initialize the HTTP client.
+
+        Args:
+            transport: Optional shared connection pool; left open on close
+        """
+        self._owns_transport = transport is None
         headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "AI-Equity-Research/1.0",
@@ -94,13 +100,14 @@ class GitHubTrackerDataSource(BaseDataSource):
         if self._token:
             headers["Authorization"] = f"token {self._token}"
 
-        self._client = httpx.AsyncClient(timeout=30.0, headers=headers)
+        self._client = httpx.AsyncClient(timeout=30.0, headers=headers, transport=transport)
         self._initialized = True
 
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
-            await self._client.aclose()
+            if self._owns_transport:
+                await self._client.aclose()
             self._client = None
 
     async def fetch(
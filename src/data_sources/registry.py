@@ -1,7 +1,11 @@
 """Data source registry and plugin management."""
 
+from functools import lru_cache
 from typing import Any, Optional
 
+from pydantic import SecretStr
+
+from config.settings import DataSourceSettings
 from src.data_sources.base import BaseDataSource, DataSourceResult, DataSourceType
 
 
@@ -193,6 +197,46 @@ def create_default_registry(
     return registry
 
 
+def _secret(value: Optional[SecretStr]) -> Optional[str]:
+    """Unwrap an optional secret setting."""
+    return value.get_secret_value() if value else None
+
+
+@lru_cache(maxsize=1)
+def _cached_default_registry(
+    news_api_key: Optional[str],
+    alpha_vantage_key: Optional[str],
+    sec_user_agent: Optional[str],
+    fred_api_key: Optional[str],
+    github_token: Optional[str],
+) -> DataSourceRegistry:
+    return create_default_registry(
+        news_api_key=news_api_key,
+        alpha_vantage_key=alpha_vantage_key,
+        sec_user_agent=sec_user_agent,
+        fred_api_key=fred_api_key,
+        github_token=github_token,
+    )
+
+
+def get_data_registry(data_sources: DataSourceSettings) -> DataSourceRegistry:
+    """Get the process-wide default registry for these credentials.
+
+    Args:
+        data_sources: Data source settings holding the API keys
+
+    Returns:
+        DataSourceRegistry shared by every caller with the same credentials
+    """
+    return _cached_default_registry(
+        _secret(data_sources.news_api_key),
+        _secret(data_sources.alpha_vantage_key),
+        data_sources.sec_user_agent,
+        _secret(data_sources.fred_api_key),
+        _secret(data_sources.github_token),
+    )
+
+
 def create_enhanced_registry(
     news_api_key: Optional[str] = None,
     alpha_vantage_key: Optional[str] = None,
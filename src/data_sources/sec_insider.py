@@ -51,23 +51,31 @@ class SECInsiderDataSource(BaseDataSource):
         """
         super().__init__(DataSourceType.REGULATORY)
         self._client: Optional[httpx.AsyncClient] = None
+        self._owns_transport = True
         self._user_agent = user_agent
 
-    async def initialize(self) -> None:
-        """Initialize the HTTP client."""
+    async def initialize(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """Initialize the HTTP client.
+
+        Args:
+            transport: Optional shared connection pool; left open on close
+        """
+        self._owns_transport = transport is None
         self._client = httpx.AsyncClient(
             timeout=30.0,
             headers={
                 "User-Agent": self._user_agent,
                 "Accept": "application/json",
-            }
+            },
+            transport=transport,
         )
         self._initialized = True
 
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
-            await self._client.aclose()
+            if self._owns_transport:
+                await self._client.aclose()
             self._client = None
 
     async def fetch(
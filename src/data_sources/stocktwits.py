@@ -29,16 +29,23 @@ class StockTwitsDataSource(BaseDataSource):
         """Initialize StockTwits data source."""
         super().__init__(DataSourceType.SOCIAL)
         self._client: Optional[httpx.AsyncClient] = None
+        self._owns_transport = True
 
-    async def initialize(self) -> None:
-        """Initialize the HTTP client."""
-        self._client = httpx.AsyncClient(timeout=30.0)
+    async def initialize(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """Initialize the HTTP client.
+
+        Args:
+            transport: Optional shared connection pool; left open on close
+        """
+        self._owns_transport = transport is None
+        self._client = httpx.AsyncClient(timeout=30.0, transport=transport)
         self._initialized = True
 
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
-            await self._client.aclose()
+            if self._owns_transport:
+                await self._client.aclose()
             self._client = None
 
     async def fetch(
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -49,9 +49,13 @@ async def run_daily_landscape(
     top_themes: int = 5,
     top_companies: int = 10,
     include_memos: bool = True,
+    report_date: Optional[str] = None,
 ) -> Dict[str, str]:
     """Run daily landscape pipeline.
 
+    Args:
+        report_date: Report date (YYYY-MM-DD); defaults to today in UTC
+
     Returns:
         Dict with output paths
     """
@@ -103,7 +107,7 @@ async def run_daily_landscape(
     top_aspects = rank_items(aspect_scores, 5)
     top_company_scores = sorted(company_scores.values(), key=lambda x: x.score, reverse=True)[:top_companies]
 
-    date_str = datetime.utcnow().strftime("%Y-%m-%d")
+    date_str = report_date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
     env = Environment(loader=FileSystemLoader(str(templates_dir)), autoescape=False)
 
@@ -1,18 +1,27 @@
 """Claude API client wrapper with structured output support."""
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional, TypeVar
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Generic, Optional, TypeVar
 
 import anthropic
 from pydantic import BaseModel
 
 from config.settings import AnthropicSettings
+from src.llm.streaming import JsonArrayScanner
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Seconds between status checks while waiting on a message batch
+BATCH_POLL_INTERVAL_S = 10.0
+
+# CEODecision fields that only echo picks the caller already holds
+_ECHOED_PICK_FIELDS = frozenset({"previous_pick", "proposed_pick", "final_pick"})
+
 
 class LLMResponse(BaseModel):
     """Response from LLM call."""
@@ -21,10 +30,78 @@ class LLMResponse(BaseModel):
     model: str
     input_tokens: int
     output_tokens: int
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
     stop_reason: Optional[str] = None
     raw_response: Optional[Dict[str, Any]] = None
 
 
+@lru_cache(maxsize=None)
+def _top_picks_response_model() -> type[BaseModel]:
+    """Reply schema for get_top_picks(), built on first use."""
+    from src.agents.base import StockPick
+
+    class TopPicksResponse(BaseModel):
+        picks: list[StockPick]
+        reasoning: str
+
+    return TopPicksResponse
+
+
+@lru_cache(maxsize=None)
+def _multi_agent_picks_response_model() -> type[BaseModel]:
+    """Reply schema for get_multi_agent_picks(), built on first use."""
+    from src.agents.base import StockPick
+
+    class MultiAgentPicksResponse(BaseModel):
+        picks_by_agent: dict[str, list[StockPick]]
+
+    return MultiAgentPicksResponse
+
+
+@lru_cache(maxsize=None)
+def _fund_manager_response_model() -> type[BaseModel]:
+    """Reply schema for synthesize_picks(), built on first use."""
+    from src.agents.base import StockPick
+
+    class FundManagerResponse(BaseModel):
+        top3: list[StockPick]
+        synthesis_reasoning: str
+        excluded_companies: list[str]
+        exclusion_reasons: dict[str, str]
+
+    return FundManagerResponse
+
+
+class StructuredItemStream(Generic[T]):
+    """Validated items of a streamed structured reply, for use with ``async for``.
+
+    ``response`` holds the reply's LLMResponse (content and token usage) once
+    iteration has finished.
+    """
+
+    __slots__ = ("response", "_source")
+
+    def __init__(self, source: AsyncIterator[Any]):
+        """Wrap a generator that yields items followed by the LLMResponse.
+
+        Args:
+            source: Item generator ending with the reply's LLMResponse
+        """
+        self.response: Optional[LLMResponse] = None
+        self._source = source
+
+    def __aiter__(self) -> "StructuredItemStream[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        value = await self._source.__anext__()
+        if isinstance(value, LLMResponse):
+            self.response = value
+            raise StopAsyncIteration
+        return value
+
+
 class LLMClient:
     """Client for Claude API with structured output support."""
 
@@ -37,7 +114,9 @@ class LLMClient:
         if not settings.api_key:
             raise ValueError("Anthropic API key is required to use the LLM client")
         self.settings = settings
-        self._client = anthropic.Anthropic(
+        # Async client, so concurrent agents and workers overlap their requests
+        # instead of blocking the event loop one call at a time
+        self._client = anthropic.AsyncAnthropic(
             api_key=settings.api_key.get_secret_value(),
         )
 
@@ -47,6 +126,7 @@ class LLMClient:
         user_message: str,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        cache_prefix: Optional[str] = None,
     ) -> LLMResponse:
         """Make a completion request.
 
@@ -55,38 +135,127 @@ class LLMClient:
             user_message: User message
             temperature: Override temperature
             max_tokens: Override max tokens
+            cache_prefix: Static start of the user turn, sent ahead of user_message
+                and marked as a prompt-cache breakpoint
 
         Returns:
             LLMResponse with completion
         """
         try:
-            response = self._client.messages.create(
-                model=self.settings.model,
-                max_tokens=max_tokens or self.settings.max_tokens,
-                temperature=temperature if temperature is not None else self.settings.temperature,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_message}
-                ],
-            )
-
-            content = ""
-            for block in response.content:
-                if block.type == "text":
-                    content += block.text
-
-            return LLMResponse(
-                content=content,
-                model=response.model,
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-                stop_reason=response.stop_reason,
+            response = await self._client.messages.create(
+                **self._message_params(
+                    system_prompt, user_message, temperature, max_tokens, cache_prefix
+                )
             )
+            return self._to_llm_response(response)
 
         except anthropic.APIError as e:
             logger.error(f"Anthropic API error: {e}")
             raise
 
+    async def complete_batch(
+        self,
+        requests: list[dict[str, Any]],
+        timeout_s: float,
+        poll_interval_s: float = BATCH_POLL_INTERVAL_S,
+    ) -> Optional[list[Optional[LLMResponse]]]:
+        """Run many independent completions through the Message Batches API.
+
+        Batched requests are billed at a discount but finish asynchronously,
+        so this polls until the batch ends or the timeout passes.
+
+        Args:
+            requests: Keyword arguments for complete(), one dict per request
+            timeout_s: Give up (and cancel the batch) after this many seconds
+            poll_interval_s: Seconds between status checks
+
+        Returns:
+            Responses in request order, with None for requests that errored or
+            expired; None overall if the batch did not end within timeout_s
+        """
+        batch = await self._client.messages.batches.create(
+            requests=[
+                # custom_id only allows [A-Za-z0-9_-], so use the request position
+                {"custom_id": str(i), "params": self._message_params(**request)}
+                for i, request in enumerate(requests)
+            ]
+        )
+        logger.info(f"Submitted message batch {batch.id} with {len(requests)} requests")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_s
+        while batch.processing_status != "ended":
+            if loop.time() >= deadline:
+                logger.warning(
+                    f"Message batch {batch.id} did not finish in {timeout_s}s, cancelling"
+                )
+                await self._client.messages.batches.cancel(batch.id)
+                return None
+            await asyncio.sleep(poll_interval_s)
+            batch = await self._client.messages.batches.retrieve(batch.id)
+
+        responses: list[Optional[LLMResponse]] = [None] * len(requests)
+        async for entry in await self._client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                responses[int(entry.custom_id)] = self._to_llm_response(entry.result.message)
+            else:
+                logger.warning(f"Batch request {entry.custom_id} {entry.result.type}")
+        return responses
+
+    def _message_params(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        cache_prefix: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Build Messages API parameters; see complete() for the arguments."""
+        system: Any = system_prompt
+        user_content: Any = user_message
+        if self.settings.prompt_caching:
+            # Agent system prompts are identical across loops, so let the API reuse
+            # the cached prefix; prompts below the minimum cacheable size are sent as-is
+            system = [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+            ]
+        if cache_prefix is not None:
+            prefix_block: dict[str, Any] = {"type": "text", "text": cache_prefix}
+            if self.settings.prompt_caching:
+                prefix_block["cache_control"] = {"type": "ephemeral"}
+            user_content = [prefix_block, {"type": "text", "text": user_message}]
+
+        return {
+            "model": self.settings.model,
+            "max_tokens": max_tokens or self.settings.max_tokens,
+            "temperature": temperature if temperature is not None else self.settings.temperature,
+            "system": system,
+            "messages": [
+                {"role": "user", "content": user_content}
+            ],
+        }
+
+    @staticmethod
+    def _to_llm_response(response: Any) -> LLMResponse:
+        """Convert an SDK Message into an LLMResponse."""
+        content = ""
+        for block in response.content:
+            if block.type == "text":
+                content += block.text
+
+        return LLMResponse(
+            content=content,
+            model=response.model,
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+            # Older SDKs don't report cache usage
+            cache_creation_input_tokens=(
+                getattr(response.usage, "cache_creation_input_tokens", None) or 0
+            ),
+            cache_read_input_tokens=getattr(response.usage, "cache_read_input_tokens", None) or 0,
+            stop_reason=response.stop_reason,
+        )
+
     async def complete_structured(
         self,
         system_prompt: str,
@@ -107,47 +276,138 @@ class LLMClient:
         Returns:
             Tuple of (parsed model, raw response)
         """
-        # Add JSON schema to system prompt
-        schema = output_model.model_json_schema()
-        enhanced_system = f"""{system_prompt}
-
-IMPORTANT: You must respond with valid JSON that matches this schema:
-```json
-{json.dumps(schema, indent=2)}
-```
-
-Respond ONLY with the JSON object, no other text."""
-
         response = await self.complete(
-            system_prompt=enhanced_system,
+            system_prompt=self._structured_system_prompt(system_prompt, output_model),
             user_message=user_message,
             temperature=temperature,
             max_tokens=max_tokens,
         )
 
-        # Parse the response
-        try:
-            # Try to extract JSON from the response
-            content = response.content.strip()
+        return self._parse_structured(response, output_model), response
+
+    def stream_structured_items(
+        self,
+        system_prompt: str,
+        user_message: str,
+        output_model: type[BaseModel],
+        items_field: str,
+        item_model: type[T],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> "StructuredItemStream[T]":
+        """Stream one list field of a structured reply, item by item.
+
+        Each item is validated as soon as its JSON object is complete, while
+        the rest of the reply is still being generated. The whole reply is
+        still validated once it ends, so a truncated or malformed reply raises
+        ValueError instead of passing as a partial list. With streaming turned
+        off in settings this falls back to complete_structured().
 
-            # Handle markdown code blocks
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
+        Args:
+            system_prompt: System prompt for the model
+            user_message: User message
+            output_model: Pydantic model for the whole reply
+            items_field: List field of output_model to stream
+            item_model: Pydantic model of one list item
+            temperature: Override temperature
+            max_tokens: Override max tokens
 
-            content = content.strip()
+        Returns:
+            Async iterable of validated items; its response is set once exhausted
+        """
+        return StructuredItemStream(
+            self._stream_items(
+                system_prompt, user_message, output_model, items_field, item_model,
+                temperature, max_tokens,
+            )
+        )
 
-            parsed = output_model.model_validate_json(content)
-            return parsed, response
+    async def _stream_items(
+        self,
+        system_prompt: str,
+        user_message: str,
+        output_model: type[BaseModel],
+        items_field: str,
+        item_model: type[T],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> AsyncIterator[Any]:
+        """Generator behind stream_structured_items; yields items, then the LLMResponse."""
+        if not self.settings.stream_responses:
+            parsed, response = await self.complete_structured(
+                system_prompt, user_message, output_model, temperature, max_tokens
+            )
+            for item in getattr(parsed, items_field):
+                yield item
+            yield response
+            return
+
+        params = self._message_params(
+            self._structured_system_prompt(system_prompt, output_model),
+            user_message,
+            temperature,
+            max_tokens,
+        )
+        scanner = JsonArrayScanner(items_field, output_model.__name__)
+        try:
+            async with self._client.messages.stream(**params) as stream:
+                async for text in stream.text_stream:
+                    for item in scanner.feed(text):
+                        yield item_model.model_validate(item)
+                message = await stream.get_final_message()
+        except anthropic.APIError as e:
+            logger.error(f"Anthropic API error: {e}")
+            raise
+        response = self._to_llm_response(message)
 
+        # Items already yielded are only kept if the reply as a whole is valid
+        if response.stop_reason == "max_tokens":
+            logger.debug(f"Raw content: {response.content}")
+            raise ValueError(f"LLM response for {output_model.__name__} was cut off at max_tokens")
+        parsed = self._parse_structured(response, output_model)
+        if not scanner.found:
+            for item in getattr(parsed, items_field):
+                yield item
+        yield response
+
+    def _parse_structured(self, response: LLMResponse, output_model: type[T]) -> T:
+        """Validate a whole reply against output_model.
+
+        Raises:
+            ValueError: If the reply is not valid JSON for output_model
+        """
+        try:
+            return output_model.model_validate_json(self._strip_code_fence(response.content))
         except Exception as e:
             logger.error(f"Failed to parse structured output: {e}")
             logger.debug(f"Raw content: {response.content}")
             raise ValueError(f"Failed to parse LLM response as {output_model.__name__}: {e}")
 
+    @staticmethod
+    def _structured_system_prompt(system_prompt: str, output_model: type[BaseModel]) -> str:
+        """Append output_model's JSON schema and a JSON-only instruction."""
+        schema = output_model.model_json_schema()
+        return f"""{system_prompt}
+
+IMPORTANT: You must respond with valid JSON that matches this schema:
+```json
+{json.dumps(schema, indent=2)}
+```
+
+Respond ONLY with the JSON object, no other text."""
+
+    @staticmethod
+    def _strip_code_fence(content: str) -> str:
+        """Extract the JSON body from a reply that may be wrapped in a markdown code block."""
+        content = content.strip()
+        if content.startswith("```json"):
+            content = content[7:]
+        if content.startswith("```"):
+            content = content[3:]
+        if content.endswith("```"):
+            content = content[:-3]
+        return content.strip()
+
     async def complete_with_retry(
         self,
         system_prompt: str,
@@ -234,26 +494,97 @@ class AgentLLMClient(LLMClient):
         Returns:
             Tuple of (list of picks, raw response)
         """
+        parsed, response = await self.complete_structured(
+            system_prompt=system_prompt,
+            user_message=self._top_picks_message(data_summary, num_picks),
+            output_model=_top_picks_response_model(),
+            temperature=0.7,
+        )
+
+        return [pick.model_dump() for pick in parsed.picks], response
+
+    def stream_top_picks(
+        self,
+        system_prompt: str,
+        data_summary: str,
+        num_picks: int = 5,
+    ) -> StructuredItemStream:
+        """Streaming variant of get_top_picks() that yields each pick as it arrives.
+
+        Args:
+            system_prompt: Agent's system prompt
+            data_summary: Market data summary
+            num_picks: Number of picks to request
+
+        Returns:
+            Async iterable of StockPick; its response is set once exhausted
+        """
         from src.agents.base import StockPick
 
-        class TopPicksResponse(BaseModel):
-            picks: list[StockPick]
-            reasoning: str
+        return self.stream_structured_items(
+            system_prompt=system_prompt,
+            user_message=self._top_picks_message(data_summary, num_picks),
+            output_model=_top_picks_response_model(),
+            items_field="picks",
+            item_model=StockPick,
+            temperature=0.7,
+        )
 
-        user_message = f"""Based on the following market data and your expertise, provide your top {num_picks} stock picks.
+    @staticmethod
+    def _top_picks_message(data_summary: str, num_picks: int) -> str:
+        """User message asking an agent for its top picks."""
+        return f"""\
+Based on the following market data and your expertise, provide your top {num_picks} stock picks.
 
 {data_summary}
 
 Analyze the data and provide your picks with conviction scores, thesis, risks, and catalysts."""
 
+    async def get_multi_agent_picks(
+        self,
+        personas: dict[str, tuple[str, str]],
+        num_picks: int = 5,
+    ) -> tuple[dict[str, list[Any]], LLMResponse]:
+        """Get top stock picks for several agents from one request.
+
+        Args:
+            personas: Agent id -> (agent system prompt, agent data summary)
+            num_picks: Number of picks to request per agent
+
+        Returns:
+            Tuple of (StockPick lists keyed by agent id, raw response); agents
+            the model left out are missing from the dict
+        """
+        sections = "\n\n".join(
+            f"""## Analyst `{agent_id}`
+
+### Persona
+{system_prompt}
+
+### Data
+{data_summary}"""
+            for agent_id, (system_prompt, data_summary) in personas.items()
+        )
+        user_message = (
+            "Answer independently as each analyst below, using only that analyst's persona "
+            "and data.\n"
+            f"For each analyst provide their top {num_picks} stock picks with conviction scores, "
+            "thesis, risks, and catalysts.\n"
+            f'Key "picks_by_agent" by the analyst ids: {", ".join(personas)}.\n\n'
+            f"{sections}"
+        )
+
         parsed, response = await self.complete_structured(
-            system_prompt=system_prompt,
+            system_prompt=(
+                "You coordinate a panel of independent equity analysts "
+                "and report each one's picks separately."
+            ),
             user_message=user_message,
-            output_model=TopPicksResponse,
+            output_model=_multi_agent_picks_response_model(),
             temperature=0.7,
         )
 
-        return [pick.model_dump() for pick in parsed.picks], response
+        return parsed.picks_by_agent, response
 
     async def get_ceo_decisions(
         self,
@@ -271,7 +602,9 @@ Analyze the data and provide your picks with conviction scores, thesis, risks, a
             loop_number: Current loop number
 
         Returns:
-            Tuple of (list of decisions, raw response)
+            Tuple of (list of decisions, raw response); decisions carry position,
+            decision and rationale only, since the picks they echo are the
+            caller's own
         """
         from src.agents.base import CEODecision
 
@@ -306,7 +639,7 @@ Remember: Only SWAP if there's a compelling reason (>15 point conviction delta o
             temperature=0.5,  # Lower temperature for more consistent decisions
         )
 
-        return [dec.model_dump() for dec in parsed.decisions], response
+        return [dec.model_dump(exclude=_ECHOED_PICK_FIELDS) for dec in parsed.decisions], response
 
     async def synthesize_picks(
         self,
@@ -322,15 +655,44 @@ Remember: Only SWAP if there's a compelling reason (>15 point conviction delta o
         Returns:
             Tuple of (final top 3 picks, raw response)
         """
+        parsed, response = await self.complete_structured(
+            system_prompt=system_prompt,
+            user_message=self._synthesis_message(layer2_outputs),
+            output_model=_fund_manager_response_model(),
+            temperature=0.6,
+        )
+
+        return [pick.model_dump() for pick in parsed.top3], response
+
+    def stream_synthesized_picks(
+        self,
+        system_prompt: str,
+        layer2_outputs: list[dict[str, Any]],
+    ) -> StructuredItemStream:
+        """Streaming variant of synthesize_picks() that yields each pick as it arrives.
+
+        Args:
+            system_prompt: Fund Manager's system prompt
+            layer2_outputs: Outputs from Layer 2 agents
+
+        Returns:
+            Async iterable of StockPick; its response is set once exhausted
+        """
         from src.agents.base import StockPick
 
-        class FundManagerResponse(BaseModel):
-            top3: list[StockPick]
-            synthesis_reasoning: str
-            excluded_companies: list[str]
-            exclusion_reasons: dict[str, str]
+        return self.stream_structured_items(
+            system_prompt=system_prompt,
+            user_message=self._synthesis_message(layer2_outputs),
+            output_model=_fund_manager_response_model(),
+            items_field="top3",
+            item_model=StockPick,
+            temperature=0.6,
+        )
 
-        user_message = f"""Synthesize the following inputs from your analysts into a final Top 3.
+    @staticmethod
+    def _synthesis_message(layer2_outputs: list[dict[str, Any]]) -> str:
+        """User message asking the Fund Manager to synthesize Layer 2 outputs."""
+        return f"""Synthesize the following inputs from your analysts into a final Top 3.
 
 Layer 2 Analyst Outputs:
 {json.dumps(layer2_outputs, indent=2)}
@@ -339,12 +701,3 @@ Create your final Top 3 picks, explaining:
 1. Why each made the cut
 2. What was excluded and why
 3. Suggested position sizing"""
-
-        parsed, response = await self.complete_structured(
-            system_prompt=system_prompt,
-            user_message=user_message,
-            output_model=FundManagerResponse,
-            temperature=0.6,
-        )
-
-        return [pick.model_dump() for pick in parsed.top3], response
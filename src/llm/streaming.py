@@ -0,0 +1,120 @@
+"""Incremental JSON helpers for streamed LLM replies."""
+
+import json
+import re
+from typing import Any, Optional
+
+# Characters that change scanner state outside / inside a JSON string
+_STRUCTURAL = re.compile(r'["{}\[\]:]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class JsonArrayScanner:
+    """Pulls complete objects out of one array field of a JSON reply while
+    the reply is still arriving.
+
+    Only the top-level object's ``field`` is watched; text around the JSON
+    (such as a markdown code fence) is skipped.
+    """
+
+    __slots__ = (
+        "field", "model_name", "found", "_text", "_pos", "_depth", "_in_string", "_string_start",
+        "_last_string", "_key", "_array_open", "_item_start",
+    )
+
+    def __init__(self, field: str, model_name: str = "JSON"):
+        """Initialize the scanner.
+
+        Args:
+            field: Name of the array field on the top-level object
+            model_name: Name of the expected reply model, used in parse errors
+        """
+        self.field = field
+        self.model_name = model_name
+        # True once the array has started, whether or not it has items yet
+        self.found = False
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+        self._key: Optional[str] = None
+        self._array_open = False
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> list[Any]:
+        """Consume the next piece of the reply.
+
+        Args:
+            chunk: Text received since the previous call
+
+        Returns:
+            Array items completed by this chunk, in order
+
+        Raises:
+            ValueError: If a completed item is not valid JSON
+        """
+        self._text += chunk
+        text = self._text
+        items = []
+        pos = self._pos
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(text, pos)
+                if match is None:
+                    break
+                if match.group() == "\\":
+                    # The escaped character may not have arrived yet
+                    if match.end() >= len(text):
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                if self._depth == 1:
+                    self._last_string = text[self._string_start:match.start()]
+                pos = match.end()
+                continue
+
+            match = _STRUCTURAL.search(text, pos)
+            if match is None:
+                pos = len(text)
+                break
+            char = match.group()
+            pos = match.end()
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif char == ":":
+                if self._depth == 1:
+                    self._key = self._last_string
+            elif char in "{[":
+                if self._depth == 1 and char == "[" and self._key == self.field and not self.found:
+                    self._array_open = self.found = True
+                elif self._depth == 2 and char == "{" and self._array_open:
+                    self._item_start = match.start()
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 2 and self._item_start is not None:
+                    try:
+                        items.append(json.loads(text[self._item_start:pos]))
+                    except json.JSONDecodeError as e:
+                        raise ValueError(
+                            f"Failed to parse LLM response as {self.model_name}: {e}"
+                        ) from e
+                    self._item_start = None
+                elif self._depth == 1:
+                    self._array_open = False
+
+        # Keep only the text a later item could still need
+        keep_from = pos if self._item_start is None else self._item_start
+        if self._in_string:
+            keep_from = min(keep_from, self._string_start)
+        self._text = text[keep_from:]
+        self._pos = pos - keep_from
+        self._string_start -= keep_from
+        if self._item_start is not None:
+            self._item_start -= keep_from
+        return items
@@ -0,0 +1,96 @@
+"""Token-aware text truncation for prompt building."""
+
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Rough estimate used when no tokenizer is available, same as LLMClient.estimate_tokens
+CHARS_PER_TOKEN = 4
+# Only this many characters per allowed token are ever encoded, so huge inputs
+# don't get tokenized in full just to be cut down
+_MAX_CHARS_PER_TOKEN = 16
+
+
+@lru_cache(maxsize=1)
+def _encoder() -> Optional[Any]:
+    """Shared tokenizer, built on first use; None if tiktoken is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:  # the encoding file is fetched on first use
+        logger.warning(f"Tokenizer unavailable, truncating by characters: {e}")
+        return None
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cut text down to at most max_tokens tokens.
+
+    cl100k_base only approximates Claude's tokenizer, but is far closer than a
+    character count. Without tiktoken, falls back to CHARS_PER_TOKEN.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+
+    Returns:
+        The text, or its longest prefix that fits the budget
+    """
+    # Every token covers at least one character
+    if len(text) <= max_tokens:
+        return text
+
+    encoder = _encoder()
+    if encoder is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+
+    tokens = encoder.encode(text[: max_tokens * _MAX_CHARS_PER_TOKEN], disallowed_special=())
+    if len(tokens) <= max_tokens and len(text) <= max_tokens * _MAX_CHARS_PER_TOKEN:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
+
+class PromptBudget:
+    """Accumulates prompt fragments up to a hard character cap.
+
+    Callers stop producing fragments once add() refuses one, so oversized
+    inputs are never fully rendered just to be thrown away.
+    """
+
+    __slots__ = ("max_chars", "parts", "used")
+
+    def __init__(self, max_chars: int):
+        """Initialize an empty budget.
+
+        Args:
+            max_chars: Maximum total length of the accepted fragments
+        """
+        self.max_chars = max_chars
+        self.parts: list[str] = []
+        self.used = 0
+
+    def add(self, fragment: str) -> bool:
+        """Append a fragment if it fits.
+
+        Args:
+            fragment: Text to append
+
+        Returns:
+            False (and nothing is appended) if the fragment would exceed the cap
+        """
+        if self.used + len(fragment) > self.max_chars:
+            return False
+        self.parts.append(fragment)
+        self.used += len(fragment)
+        return True
+
+    def text(self) -> str:
+        """Join the accepted fragments."""
+        return "".join(self.parts)
@@ -35,12 +35,14 @@ class DiscordNotifier:
         self,
         content: str,
         embeds: Optional[list[dict[str, Any]]] = None,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> bool:
         """Send a message to Discord.
 
         Args:
             content: Message content
             embeds: Optional Discord embeds for rich formatting
+            client: Optional shared HTTP client; a new one is opened if omitted
 
         Returns:
             True if sent successfully
@@ -54,13 +56,20 @@ class DiscordNotifier:
             if embeds:
                 payload["embeds"] = embeds
 
-            async with httpx.AsyncClient() as client:
+            if client is None:
+                async with httpx.AsyncClient() as owned_client:
+                    response = await owned_client.post(
+                        self.webhook_url,
+                        json=payload,
+                        timeout=10.0,
+                    )
+            else:
                 response = await client.post(
                     self.webhook_url,
                     json=payload,
                     timeout=10.0,
                 )
-                response.raise_for_status()
+            response.raise_for_status()
 
             logger.info("Discord notification sent")
             return True
@@ -74,6 +83,7 @@ class DiscordNotifier:
         run_id: str,
         summary: str,
         picks: list[dict[str, Any]],
+        client: Optional[httpx.AsyncClient] = None,
     ) -> bool:
         """Send research completion notification with rich embed.
 
@@ -81,6 +91,7 @@ class DiscordNotifier:
             run_id: Research run ID
             summary: Summary text
             picks: Final picks list
+            client: Optional shared HTTP client; a new one is opened if omitted
 
         Returns:
             True if sent successfully
@@ -126,18 +137,20 @@ class DiscordNotifier:
                     "inline": False,
                 })
 
-        return await self.send("", [embed])
+        return await self.send("", [embed], client=client)
 
     async def send_error(
         self,
         run_id: str,
         error: str,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> bool:
         """Send error notification.
 
         Args:
             run_id: Research run ID
             error: Error message
+            client: Optional shared HTTP client; a new one is opened if omitted
 
         Returns:
             True if sent successfully
@@ -159,13 +172,14 @@ class DiscordNotifier:
             ],
         }
 
-        return await self.send("", [embed])
+        return await self.send("", [embed], client=client)
 
     async def send_progress(
         self,
         run_id: str,
         loop_number: int,
         status: str,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> bool:
         """Send progress update.
 
@@ -173,6 +187,7 @@ class DiscordNotifier:
             run_id: Research run ID
             loop_number: Current loop number
             status: Current status
+            client: Optional shared HTTP client; a new one is opened if omitted
 
         Returns:
             True if sent successfully
@@ -199,4 +214,4 @@ class DiscordNotifier:
             ],
         }
 
-        return await self.send("", [embed])
+        return await self.send("", [embed], client=client)
@@ -35,12 +35,14 @@ class SlackNotifier:
         self,
         message: str,
         blocks: Optional[list[dict[str, Any]]] = None,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> bool:
         """Send a message to Slack.
 
         Args:
             message: Fallback text message
             blocks: Optional Slack blocks for rich formatting
+            client: Optional shared HTTP client; a new one is opened if omitted
 
         Returns:
             True if sent successfully
@@ -54,13 +56,20 @@ class SlackNotifier:
             if blocks:
                 payload["blocks"] = blocks
 
-            async with httpx.AsyncClient() as client:
+            if client is None:
+                async with httpx.AsyncClient() as owned_client:
+                    response = await owned_client.post(
+                        self.webhook_url,
+                        json=payload,
+                        timeout=10.0,
+                    )
+            else:
                 response = await client.post(
                     self.webhook_url,
                     json=payload,
                     timeout=10.0,
                 )
-                response.raise_for_status()
+            response.raise_for_status()
 
             logger.info("Slack notification sent")
             return True
@@ -74,6 +83,7 @@ class SlackNotifier:
         run_id: str,
         summary: str,
         picks: list[dict[str, Any]],
+        client: Optional[httpx.AsyncClient] = None,
     ) -> bool:
         """Send research completion notification with rich formatting.
 
@@ -81,6 +91,7 @@ class SlackNotifier:
             run_id: Research run ID
             summary: Summary text
             picks: Final picks list
+            client: Optional shared HTTP client; a new one is opened if omitted
 
         Returns:
             True if sent successfully
@@ -139,18 +150,20 @@ class SlackNotifier:
             ],
         })
 
-        return await self.send(summary, blocks)
+        return await self.send(summary, blocks, client=client)
 
     async def send_error(
         self,
         run_id: str,
         error: str,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> bool:
         """Send error notification.
 
         Args:
             run_id: Research run ID
             error: Error message
+            client: Optional shared HTTP client; a new one is opened if omitted
 
         Returns:
             True if sent successfully
@@ -173,4 +186,4 @@ class SlackNotifier:
             },
         ]
 
-        return await self.send(f"Research error: {error}", blocks)
+        return await self.send(f"Research error: {error}", blocks, client=client)
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from src.agents.base import AgentOutput, Layer1Agent, Layer2Agent, StockPick
+from src.agents.layer2.runner import run_layer2, run_layer2_batched
 from src.agents.layer3.fund_manager import FundManagerAgentImpl
 from src.agents.layer4.ceo import CEOAgentImpl
 from src.data_sources.aggregator import AggregatedCompanyData, DataAggregator
@@ -21,15 +22,21 @@ class LayerExecutor:
         self,
         llm_client: AgentLLMClient,
         data_aggregator: DataAggregator,
+        batch_layer2: bool = False,
+        layer2_max_concurrency: Optional[int] = None,
     ):
         """Initialize the layer executor.
 
         Args:
             llm_client: LLM client for agent calls
             data_aggregator: Data aggregator for market data
+            batch_layer2: Answer all Layer 2 agents with one combined LLM request
+            layer2_max_concurrency: Cap on simultaneous Layer 2 requests
         """
         self.llm_client = llm_client
         self.data_aggregator = data_aggregator
+        self.batch_layer2 = batch_layer2
+        self.layer2_max_concurrency = layer2_max_concurrency
 
     async def execute_layer1(
         self,
@@ -129,7 +136,7 @@ class LayerExecutor:
                 {
                     "agent_id": o.agent_id,
                     "agent_name": o.agent_name,
-                    "picks": [p.model_dump() for p in o.picks],
+                    "picks": [p.cached_dump() for p in o.picks],
                     "reasoning": o.reasoning,
                 }
                 for o in layer1_outputs
@@ -145,29 +152,14 @@ class LayerExecutor:
         }
 
         # Execute agents in parallel
-        tasks = []
         for agent in agents:
             agent.set_llm_client(self.llm_client)
-            tasks.append(agent.analyze(data, context))
-
-        outputs = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle exceptions
-        results = []
-        for i, output in enumerate(outputs):
-            if isinstance(output, Exception):
-                logger.error(f"Agent {agents[i].agent_id} failed: {output}")
-                results.append(
-                    AgentOutput(
-                        agent_id=agents[i].agent_id,
-                        agent_name=agents[i].name,
-                        layer=agents[i].layer,
-                        picks=[],
-                        reasoning=f"Error: {str(output)}",
-                    )
-                )
-            else:
-                results.append(output)
+        if self.batch_layer2 and len(agents) > 1:
+            results = await run_layer2_batched(
+                agents, data, context, self.llm_client, self.layer2_max_concurrency
+            )
+        else:
+            results = await run_layer2(agents, data, context, self.layer2_max_concurrency)
 
         logger.info(f"Layer 2 complete: {sum(len(o.picks) for o in results)} total picks")
         return results
@@ -197,7 +189,7 @@ class LayerExecutor:
                 {
                     "agent_id": o.agent_id,
                     "agent_name": o.agent_name,
-                    "picks": [p.model_dump() for p in o.picks],
+                    "picks": [p.cached_dump() for p in o.picks],
                     "reasoning": o.reasoning,
                 }
                 for o in layer2_outputs
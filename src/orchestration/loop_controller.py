@@ -70,7 +70,12 @@ class LoopController:
         # Initialize components
         self.llm_client = AgentLLMClient(settings.anthropic)
         self.data_aggregator = DataAggregator(data_registry)
-        self.layer_executor = LayerExecutor(self.llm_client, self.data_aggregator)
+        self.layer_executor = LayerExecutor(
+            self.llm_client,
+            self.data_aggregator,
+            batch_layer2=settings.loop.batch_layer2,
+            layer2_max_concurrency=settings.loop.layer2_max_concurrency,
+        )
         self.convergence_detector = ConvergenceDetector(
             perfect_match_loops=settings.loop.perfect_match_loops,
             set_stability_loops=settings.loop.set_stability_loops,
@@ -155,7 +160,7 @@ class LoopController:
                         "loop_number": convergence.loop_number,
                     }
                     self._current_run.final_picks = [
-                        p.model_dump() for p in result["final_top3"]
+                        p.cached_dump() for p in result["final_top3"]
                     ]
                     break
 
@@ -203,17 +208,17 @@ class LoopController:
             LoopIteration record
         """
         layer1_picks = {
-            output.agent_id: [p.model_dump() for p in output.picks]
+            output.agent_id: [p.cached_dump() for p in output.picks]
             for output in result["layer1_outputs"]
         }
 
         layer2_picks = {
-            output.agent_id: [p.model_dump() for p in output.picks]
+            output.agent_id: [p.cached_dump() for p in output.picks]
             for output in result["layer2_outputs"]
         }
 
-        proposed = [p.model_dump() for p in result["layer3_output"].picks]
-        final = [p.model_dump() for p in result["final_top3"]]
+        proposed = [p.cached_dump() for p in result["layer3_output"].picks]
+        final = [p.cached_dump() for p in result["final_top3"]]
 
         ceo_output = result["layer4_output"]
         decisions = [d.model_dump() for d in ceo_output.decisions]
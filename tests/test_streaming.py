@@ -0,0 +1,105 @@
+"""Tests for the incremental JSON array scanner."""
+
+import json
+
+import pytest
+
+from src.llm.streaming import JsonArrayScanner
+
+PICKS = [
+    {"ticker": "NVDA", "thesis": 'Says "AI]} demand" is durable', "risks": ["supply", "export"]},
+    {"ticker": "MSFT", "thesis": "Path C:\\models\\ and a trailing \\", "risks": []},
+    {
+        "ticker": "TSM",
+        "thesis": "Nested {\"a\": [1, [2]]} in text",
+        "catalysts": [[1, 2], {"q": [3]}],
+    },
+]
+
+
+def feed_in_chunks(scanner: JsonArrayScanner, reply: str, size: int) -> list:
+    """Feed reply to scanner size characters at a time, collecting items."""
+    items = []
+    for start in range(0, len(reply), size):
+        items.extend(scanner.feed(reply[start:start + size]))
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_unfenced_reply(size):
+    reply = json.dumps({"picks": PICKS, "summary": "ok"})
+    scanner = JsonArrayScanner("picks")
+
+    assert feed_in_chunks(scanner, reply, size) == PICKS
+    assert scanner.found
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_fenced_reply(size):
+    reply = "```json\n" + json.dumps({"picks": PICKS}, indent=2) + "\n```"
+    scanner = JsonArrayScanner("picks")
+
+    assert feed_in_chunks(scanner, reply, size) == PICKS
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_prose_before_json(size):
+    reply = 'Here are my picks, "as requested" [draft]:\n' + json.dumps({"picks": PICKS})
+    scanner = JsonArrayScanner("picks")
+
+    assert feed_in_chunks(scanner, reply, size) == PICKS
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_escapes_at_chunk_boundaries(size):
+    items = [{"thesis": 'a\\"b'}, {"thesis": "\\\\"}, {"thesis": '\\"}]\\\\'}]
+    reply = json.dumps({"picks": items})
+    # Shift the reply so escapes land on every chunk position
+    for offset in range(size):
+        scanner = JsonArrayScanner("picks")
+        assert feed_in_chunks(scanner, " " * offset + reply, size) == items
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_ignores_other_array_fields(size):
+    reply = json.dumps(
+        {
+            "watchlist": [{"ticker": "AMD"}],
+            "notes": {"picks": [{"ticker": "INTC"}]},
+            "picks": PICKS[:1],
+            "removed": [{"ticker": "META"}],
+        }
+    )
+    scanner = JsonArrayScanner("picks")
+
+    assert feed_in_chunks(scanner, reply, size) == PICKS[:1]
+
+
+def test_missing_field_is_not_found():
+    scanner = JsonArrayScanner("picks")
+
+    assert feed_in_chunks(scanner, json.dumps({"other": PICKS}), 2) == []
+    assert not scanner.found
+
+
+def test_empty_array_is_found():
+    scanner = JsonArrayScanner("picks")
+
+    assert feed_in_chunks(scanner, '{"picks": []}', 1) == []
+    assert scanner.found
+
+
+def test_buffer_is_trimmed_between_items():
+    scanner = JsonArrayScanner("picks")
+    feed_in_chunks(scanner, '{"picks": [' + ", ".join(json.dumps(p) for p in PICKS * 50), 3)
+
+    assert len(scanner._text) < 10
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_malformed_item_raises_value_error(size):
+    reply = '{"picks": [{"ticker": "NVDA"}, {"a": 1,}]}'
+    scanner = JsonArrayScanner("picks", "TopPicksResponse")
+
+    with pytest.raises(ValueError, match="^Failed to parse LLM response as TopPicksResponse: "):
+        feed_in_chunks(scanner, reply, size)